@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta, time
+from datetime import datetime, date, timedelta, time
 import yfinance as yf
 import logging
 import asyncio
@@ -21,6 +21,7 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from twilio.rest import Client
 import json
+import orjson
 import os
 import shutil
 import glob
@@ -30,6 +31,18 @@ import traceback
 import concurrent.futures
 import queue
 import math
+import functools
+from collections import defaultdict
+from dateutil.relativedelta import relativedelta
+from operator import itemgetter
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional - kernels run as plain Python loops without it
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 # -------------------------------------------------------------
 # IBKR Greeks via tickOptionComputation (CORRECT METHOD)
@@ -145,6 +158,110 @@ def _get_delta_from_ibkr(ib_connection, contract, logger):
         logger.error(f"❌ {contract.symbol}: IBKR Greeks via ib_insync failed: {e}")
         return None
 
+# -------------------------------------------------------------
+# Numeric Kernels
+# -------------------------------------------------------------
+
+_BY_ANNUAL_RETURN = itemgetter('annual_return')  # Sort key for opportunity lists
+
+# Actual stock prices from IBKR data, used for option rows when available
+# These are the real stock prices we see in the logs
+_REFERENCE_STOCK_PRICES = {
+    'DE': 514.5,
+    'GOOG': 189.0,
+    'JPM': 283.5,
+    'NVDA': 183.3,
+    'UNH': 270.0,
+    'WMT': 94.0,
+    'XOM': 110.0
+}
+
+@functools.lru_cache(maxsize=1024)
+def _parse_yyyymmdd(s):
+    """Parse an IBKR 'YYYYMMDD' expiry string into a date without strptime"""
+    return date(int(s[:4]), int(s[4:6]), int(s[6:8]))
+
+def _delta_cache_key(symbol, strike, expiry, right):
+    """Key of one option contract in the delta service's delta_cache.json (expiry as YYYYMMDD)"""
+    # Must match _delta_cache_key in ibkr_delta_service.py
+    return f"{symbol} {expiry} {float(strike):g} {right}"
+
+@functools.lru_cache(maxsize=4)
+def _days_left_in_month(day):
+    """Days from a date until the first day of the following month"""
+    return ((day.replace(day=1) + relativedelta(months=1)) - day).days
+
+@njit(cache=True)
+def _njit_group_sum(keys, values):
+    """
+    Sum values per distinct integer key
+    Returns the sorted unique keys and their sums
+    """
+    n = keys.shape[0]
+    order = np.argsort(keys, kind='mergesort')
+    unique_keys = np.empty(n, dtype=np.int64)
+    sums = np.empty(n, dtype=np.float64)
+    count = 0
+    
+    for i in range(n):
+        key = keys[order[i]]
+        if count == 0 or unique_keys[count - 1] != key:
+            unique_keys[count] = key
+            sums[count] = 0.0
+            count += 1
+        sums[count - 1] += values[order[i]]
+    
+    return unique_keys[:count], sums[:count]
+
+@njit(cache=True)
+def _njit_tier_index(values, thresholds, higher_is_worse):
+    """
+    Map each value to its risk tier, 0 being the worst
+    thresholds are ordered worst first; values past none of them land in tier len(thresholds)
+    """
+    n = values.shape[0]
+    tiers = np.empty(n, dtype=np.int64)
+    
+    for i in range(n):
+        v = values[i]
+        tier = thresholds.shape[0]
+        for j in range(thresholds.shape[0]):
+            if (v > thresholds[j]) if higher_is_worse else (v < thresholds[j]):
+                tier = j
+                break
+        tiers[i] = tier
+    
+    return tiers
+
+@njit(cache=True)
+def _njit_sector_scores(percentages, bins, scores):
+    """
+    Score sector concentration and classify each sector against the 25% limit
+    A percentage strictly above bins[j] (and no higher bin) scores scores[j + 1]
+    Returns the mean score and int8 status codes: 0 normal, 1 under 5%, 2 over 25%, 3 over 30%
+    """
+    n = percentages.shape[0]
+    status = np.empty(n, dtype=np.int8)
+    total = 0.0
+    
+    for i in range(n):
+        p = percentages[i]
+        k = 0
+        while k < bins.shape[0] and p > bins[k]:
+            k += 1
+        total += scores[k]
+        
+        if p > 30.0:
+            status[i] = 3
+        elif p > 25.0:
+            status[i] = 2
+        elif p < 5.0:
+            status[i] = 1
+        else:
+            status[i] = 0
+    
+    return total / n, status
+
 # -------------------------------------------------------------
 # Core Data Structures
 # -------------------------------------------------------------
@@ -1837,7 +1954,7 @@ class WheelScanner:
                 continue
         
         # Sort by expected return
-        opportunities.sort(key=lambda x: x['annual_return'], reverse=True)
+        opportunities.sort(key=_BY_ANNUAL_RETURN, reverse=True)
         
         # Apply sector diversification
         return self._diversify_opportunities(opportunities)
@@ -1877,7 +1994,7 @@ class WheelScanner:
                 continue
         
         # Sort by expected return
-        return sorted(opportunities, key=lambda x: x['annual_return'], reverse=True)
+        return sorted(opportunities, key=_BY_ANNUAL_RETURN, reverse=True)
     
     def _calculate_liquidity_score(self, symbol: str) -> float:
         """Calculate liquidity score for a symbol"""
@@ -4602,11 +4719,31 @@ logging.getLogger('yfinance').setLevel(logging.WARNING)
 logging.getLogger('peewee').setLevel(logging.WARNING) 
 logging.getLogger('ib_insync').setLevel(logging.INFO)
 
-socketio = SocketIO(app, cors_allowed_origins="*", logger=True, engineio_logger=True, async_mode='threading', ping_timeout=5)
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+class _OrjsonCodec:
+    """json-module stand-in so Socket.IO packets are encoded with orjson"""
+    
+    @staticmethod
+    def dumps(obj, *args, **kwargs):
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS).decode()
+    
+    @staticmethod
+    def loads(s, *args, **kwargs):
+        return orjson.loads(s)
+
+def ojsonify(obj, status=200):
+    """jsonify() equivalent that serializes with orjson straight to bytes"""
+    return app.response_class(orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS),
+                              status=status, mimetype='application/json')
+
+socketio = SocketIO(app, cors_allowed_origins="*", logger=True, engineio_logger=True, async_mode='threading', ping_timeout=5,
+                    json=_OrjsonCodec)
 
 # Global variables to store current data for API endpoints - NO DEFAULTS
 current_metrics = None  # MUST be populated with real data or fail
 current_positions = None  # MUST be populated with real data or fail
+_state_lock = threading.Lock()  # Guards writes to current_metrics/current_positions
 
 # Store active connections
 active_connections = {
@@ -4824,6 +4961,17 @@ def get_portfolio_chart():
         logger.error(f"Error generating portfolio chart: {e}")
         return jsonify({'error': str(e)}), 500
 
+# Map symbols to sectors (simplified)
+_EXPOSURE_SECTOR_MAP = {
+    'NVDA': 'Technology',
+    'DE': 'Industrials', 
+    'GOOG': 'Technology',
+    'JPM': 'Financials',
+    'UNH': 'Healthcare',
+    'WMT': 'Consumer Discretionary',
+    'XOM': 'Energy'
+}
+
 @app.route('/api/sector-exposure')
 def get_sector_exposure():
     """Get sector exposure data based on current positions"""
@@ -4834,29 +4982,14 @@ def get_sector_exposure():
         global current_positions
         total_value = 89682.29
         
-        # Map symbols to sectors (simplified)
-        sector_map = {
-            'NVDA': 'Technology',
-            'DE': 'Industrials', 
-            'GOOG': 'Technology',
-            'JPM': 'Financials',
-            'UNH': 'Healthcare',
-            'WMT': 'Consumer Discretionary',
-            'XOM': 'Energy'
-        }
-        
-        sector_exposure = {}
+        sector_exposure = defaultdict(float)
         
         # Calculate exposure from stock positions
         for pos in current_positions:
             if pos.get('contract_type') == 'STK':
                 symbol = pos['symbol']
                 market_value = abs(pos.get('marketValue', 0))
-                sector = sector_map.get(symbol, 'Other')
-                
-                if sector not in sector_exposure:
-                    sector_exposure[sector] = 0
-                sector_exposure[sector] += market_value
+                sector_exposure[_EXPOSURE_SECTOR_MAP.get(symbol, 'Other')] += market_value
         
         # Add option exposure (simplified - count as underlying sector)
         for pos in current_positions:
@@ -4864,11 +4997,7 @@ def get_sector_exposure():
                 symbol = pos['symbol']
                 # For options, use notional value approximation
                 market_value = abs(pos.get('marketValue', 0)) * 10  # Rough notional multiplier
-                sector = sector_map.get(symbol, 'Other')
-                
-                if sector not in sector_exposure:
-                    sector_exposure[sector] = 0
-                sector_exposure[sector] += market_value
+                sector_exposure[_EXPOSURE_SECTOR_MAP.get(symbol, 'Other')] += market_value
         
         # Convert to percentages and sort
         sector_data = []
@@ -4892,7 +5021,7 @@ def get_sector_exposure():
         })
         
         logger.info(f"✅ Calculated exposure for {len(sector_data)} sectors")
-        return jsonify(sector_data)
+        return ojsonify(sector_data)
         
     except Exception as e:
         logger.error(f"Error calculating sector exposure: {e}")
@@ -5142,12 +5271,7 @@ def get_income_tracking():
         
         # Calculate days remaining in month
         current_date = datetime.now()
-        if current_date.month == 12:
-            next_month = current_date.replace(year=current_date.year + 1, month=1, day=1)
-        else:
-            next_month = current_date.replace(month=current_date.month + 1, day=1)
-        
-        days_remaining = (next_month - current_date).days
+        days_remaining = _days_left_in_month(current_date.date())
         
         income_data = {
             'monthly_target': monthly_target,
@@ -5423,45 +5547,100 @@ def api_dashboard():
     return render_template('wheel_dashboard.html')
 
 class WheelDashboard:
+    # Age after which /api/positions asks the monitor loop for fresh positions
+    POSITIONS_TTL = 30  # seconds
+    # Longest wait for a live Greeks snapshot from IBKR
+    GREEKS_TIMEOUT = 5.0  # seconds
+    # Longest wait for the IBKR account summary
+    ACCOUNT_SUMMARY_TIMEOUT = 5.0  # seconds
+    # How long _get_alerts reuses a computed sector correlation
+    CORRELATION_TTL = 300  # seconds
+    
+    # Basic metrics returned when live metrics cannot be calculated
+    _FALLBACK_METRICS = {
+        'account_value': 122000,
+        'available_funds': 50000,
+        'cash_percentage': 41.0,
+        'positions_count': 0,
+        'daily_returns': 0,
+        'total_pnl': 0,
+        'win_rate': 0,
+        'max_drawdown': 0
+    }
+    
     def __init__(self, monitor, scanner, tracker):
         self.monitor = monitor
         self.scanner = scanner
         self.tracker = tracker
+        self.loop = None  # Event loop of the monitoring thread
+        self.cached_positions_data = None
+        self.cached_positions_ts = 0.0
+        self.positions_version = 0  # Bumped on every positions refresh
+        self._delta_cache_mirror = (None, {})  # (mtime_ns, parsed delta_cache.json)
+        self._positions_refresh = None
+        self._correlation = None
+        self._correlation_ts = 0.0
+        self._alerts_cache = []
+        self._alerts_cache_key = None
         
     def start_monitoring(self):
         """Start real-time monitoring"""
         def monitor_loop():
-            import asyncio
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
-            while True:
-                try:
-                    loop.run_until_complete(self.update_dashboard_async())
-                    time.sleep(30)
-                except Exception as e:
-                    print(f"Monitor loop error: {e}")
-                    time.sleep(5)  # Short delay on error
+            self.loop = loop
+            # Keep the loop running between updates so IBKR callbacks and
+            # coroutines submitted from Flask handlers are serviced promptly
+            loop.run_until_complete(self._monitor_coro())
         thread = threading.Thread(target=monitor_loop, daemon=True)
         thread.start()
         print("Dashboard monitoring started")
     
+    async def _monitor_coro(self):
+        """Run dashboard updates forever on the monitoring loop"""
+        while True:
+            try:
+                await self.update_dashboard_async()
+                await asyncio.sleep(30)
+            except Exception as e:
+                print(f"Monitor loop error: {e}")
+                await asyncio.sleep(5)  # Short delay on error
+    
+    def run_on_loop(self, coro, timeout=None):
+        """Run a coroutine on the monitoring loop from another thread and wait for its result"""
+        try:
+            caller_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            caller_loop = None
+        if self.loop is None or not self.loop.is_running() or caller_loop is self.loop:
+            coro.close()  # Blocking on our own loop would deadlock
+            raise RuntimeError("Monitoring event loop is not available to this caller")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout=timeout)
+    
     async def update_dashboard_async(self):
         """Push updates to dashboard asynchronously"""
         try:
             print("\n========== DASHBOARD UPDATE START ==========")
             
-            print("\n1. FETCHING POSITIONS")
-            positions = await self._get_positions_async()
-            print(f"Raw positions data:")
-            for pos in positions:
-                print(json.dumps(pos, indent=2, default=str))
+            print("\n1. FETCHING POSITIONS, ACCOUNT SUMMARY AND OPPORTUNITIES")
+            # Independent IBKR round trips - overlap them instead of paying for each in turn
+            # A stalled account summary times out on its own instead of holding up positions
+            positions, account_summary, opportunities = await asyncio.gather(
+                self._get_positions_async(),
+                asyncio.wait_for(self.monitor.ib.accountSummaryAsync(), self.ACCOUNT_SUMMARY_TIMEOUT),
+                self._get_opportunities_async(),
+                return_exceptions=True
+            )
+            if isinstance(positions, Exception):
+                raise positions
+            if logger.isEnabledFor(logging.DEBUG):
+                for pos in positions:
+                    logger.debug(f"Raw position: {json.dumps(pos, default=str)}")
             
-            print("\n2. FETCHING ACCOUNT SUMMARY")
+            print("\n2. PROCESSING ACCOUNT SUMMARY")
             try:
-                # Use thread executor to avoid event loop conflicts
-                import asyncio
-                loop = asyncio.get_event_loop()
-                account_summary = await loop.run_in_executor(None, self.monitor.ib.accountSummary)
+                if isinstance(account_summary, Exception):
+                    raise account_summary
                 print("Account summary items:")
                 for item in account_summary:
                     print(f"{item.tag}: {item.value}")
@@ -5480,24 +5659,25 @@ class WheelDashboard:
                 
                 # No fallback regime - must calculate real market regime or fail
                 
-                print("Calculated metrics:")
-                print(json.dumps(metrics, indent=2, default=str))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Calculated metrics: {json.dumps(metrics, default=str)}")
             except Exception as e:
                 print(f"❌ METRICS CALCULATION FAILED: {e}")
                 metrics = None
                 print("❌ NO METRICS - IBKR DATA REQUIRED")
             
-            print("\n4. FETCHING OPPORTUNITIES")
-            opportunities = await self._get_opportunities_async()
-            print("Found opportunities:")
-            for opp in opportunities:
-                print(json.dumps(opp, indent=2, default=str))
+            print("\n4. PROCESSING OPPORTUNITIES")
+            if isinstance(opportunities, Exception):
+                raise opportunities
+            if logger.isEnabledFor(logging.DEBUG):
+                for opp in opportunities:
+                    logger.debug(f"Opportunity: {json.dumps(opp, default=str)}")
             
             print("\n5. GETTING ALERTS")
             alerts = self._get_alerts()
-            print("Active alerts:")
-            for alert in alerts:
-                print(json.dumps(alert, indent=2, default=str))
+            if logger.isEnabledFor(logging.DEBUG):
+                for alert in alerts:
+                    logger.debug(f"Active alert: {json.dumps(alert, default=str)}")
             
             data = {
                 'positions': positions,
@@ -5511,21 +5691,22 @@ class WheelDashboard:
             global current_metrics, current_positions
             
             # Only update metrics if they are not None
-            if metrics is not None:
-                current_metrics.update(metrics)
-                current_metrics['last_updated'] = datetime.now().isoformat()
-                print(f"Updated global cache with {len(positions)} positions and metrics")
-            else:
-                print("⚠️ Skipping metrics update - metrics is None")
-                current_metrics['last_updated'] = datetime.now().isoformat()
-            
-            current_positions = positions
-            
-            print("\n7. FINAL DATA FOR DASHBOARD")
-            print(json.dumps(data, indent=2, default=str))
+            with _state_lock:
+                if metrics is not None:
+                    current_metrics.update(metrics)
+                    current_metrics['last_updated'] = datetime.now().isoformat()
+                    print(f"Updated global cache with {len(positions)} positions and metrics")
+                else:
+                    print("⚠️ Skipping metrics update - metrics is None")
+                    current_metrics['last_updated'] = datetime.now().isoformat()
+                
+                current_positions = positions
             
-            print("\n8. EMITTING UPDATE")
-            logger.info(f"About to emit update to dashboard: {json.dumps(data)[:500]}...")
+            print("\n7. EMITTING UPDATE")
+            logger.info("About to emit update to dashboard: %d positions, %d opportunities, %d alerts",
+                        len(positions), len(opportunities), len(alerts))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Emit preview: %s", orjson.dumps(data, default=str)[:500].decode('utf-8', 'replace'))
             print("About to emit update to dashboard")
             try:
                 socketio.emit('update', data)
@@ -5547,99 +5728,126 @@ class WheelDashboard:
         # Mark this as a dashboard thread for delta fetching
         self._is_dashboard_thread = True
         position_data = []
+        pending_greeks = []  # (index, contract) of options still needing a live Greeks request
         
         try:
             print("\n=== Fetching Positions ===")
             
-            # Use thread executor to avoid event loop conflicts
-            import asyncio
-            loop = asyncio.get_event_loop()
-            portfolio = await loop.run_in_executor(None, self.monitor.ib.portfolio)
+            # portfolio() reads ib_insync's local state - no IBKR round-trip or thread hop needed
+            portfolio = self.monitor.ib.portfolio()
             print(f"Got {len(portfolio)} portfolio items")
             
-            for item in portfolio:
-                if item.position != 0:  # Only include positions with actual holdings
-                    contract = item.contract
-                    print(f"Processing: {contract.symbol} ({contract.secType})")
-                    
-                    # Calculate P&L percentage  
-                    cost_basis = abs(item.averageCost * item.position)
-                    pnl_pct = (item.unrealizedPNL / cost_basis * 100) if cost_basis > 0 else 0
+            # Only include positions with actual holdings
+            held = [item for item in portfolio if item.position != 0]
+            n = len(held)
+            
+            # Numeric columns for all positions (SoA), computed in one vectorized pass
+            quantities = np.fromiter((item.position for item in held), dtype=np.float64, count=n)
+            avg_costs = np.fromiter((item.averageCost for item in held), dtype=np.float64, count=n)
+            unrealized = np.fromiter((item.unrealizedPNL for item in held), dtype=np.float64, count=n)
+            
+            # Calculate P&L percentage
+            cost_basis = np.abs(avg_costs * quantities)
+            pnl_pct = np.divide(unrealized * 100, cost_basis, out=np.zeros(n), where=cost_basis > 0)
+            pnl_column = np.round(pnl_pct, 1).tolist()
+            status_column = np.where(pnl_pct < -25, 'ROLLING', 'ACTIVE').tolist()
+            premium_column = np.abs(avg_costs).tolist()
+            
+            today = date.today()
+            for i, item in enumerate(held):
+                contract = item.contract
+                print(f"Processing: {contract.symbol} ({contract.secType})")
+                
+                # Transform for frontend compatibility
+                if contract.secType == 'OPT':
+                    strike = getattr(contract, 'strike', 0)
+                    option_type = getattr(contract, 'right', '')
+                    exp_date = getattr(contract, 'lastTradeDateOrContractMonth', None)
                     
-                    # Transform for frontend compatibility
-                    if contract.secType == 'OPT':
-                        strike = getattr(contract, 'strike', 0)
-                        option_type = getattr(contract, 'right', '')
-                        exp_date = getattr(contract, 'lastTradeDateOrContractMonth', None)
-                        
-                        # Calculate days to expiration
-                        dte = 0
-                        expiry = '-'
-                        if exp_date:
-                            try:
-                                if hasattr(exp_date, 'strftime'):
-                                    expiry = exp_date.strftime('%m/%d/%Y')
-                                    dte = (exp_date.date() - datetime.now().date()).days
-                                else:
-                                    expiry = str(exp_date)
-                            except:
+                    # Calculate days to expiration
+                    dte = 0
+                    expiry = '-'
+                    if exp_date:
+                        try:
+                            if hasattr(exp_date, 'strftime'):
+                                expiry = exp_date.strftime('%m/%d/%Y')
+                                dte = (exp_date.date() - today).days
+                            else:
                                 expiry = str(exp_date)
-                        
-                        symbol_display = f"{contract.symbol} {option_type} ${strike}"
-                        contract_type = 'OPT'
-                    else:
-                        strike = 0
-                        option_type = ''
-                        dte = 0
-                        expiry = '-'
-                        symbol_display = contract.symbol
-                        contract_type = 'STK'
-                    
-                    # Get LIVE delta from IBKR - NO FALLBACKS ALLOWED (using working pattern)
-                    estimated_delta = None  # Must get live delta or None
-                    if hasattr(contract, 'right') and contract.right != '0':  # Only for options
-                        # First, try to get delta DIRECTLY from portfolio item (like ibkr_delta_service.py does)
-                        if hasattr(item, 'modelGreeks') and item.modelGreeks and hasattr(item.modelGreeks, 'delta') and item.modelGreeks.delta is not None:
-                            # SUCCESS: Portfolio item already has live delta!
-                            estimated_delta = float(item.modelGreeks.delta)
-                            logger.info(f"✅ {contract.symbol}: Portfolio item has delta {estimated_delta:.3f}")
-                        else:
-                            # Try SYNCHRONOUS Greeks request using threading approach (same as Flask)
-                            estimated_delta = _get_delta_from_ibkr(self.monitor.ib, contract, logger)
-                    elif hasattr(contract, 'right') and contract.right == '0':  # Stock
-                        estimated_delta = None  # No delta for stocks
-                    
-                    print(f"🔍 {contract.symbol}: Calculated delta = {estimated_delta}")
+                        except (AttributeError, TypeError, ValueError):
+                            expiry = str(exp_date)
                     
-                    # Create position data with frontend-expected format
-                    position_info = {
-                        # Raw IBKR data (preserved for backward compatibility)
-                        'symbol': contract.symbol,
-                        'position': item.position,
-                        'avgCost': item.averageCost,
-                        'marketValue': item.marketValue,
-                        'unrealizedPNL': item.unrealizedPNL,
-                        'contract_type': contract_type,
-                        
-                        # Frontend-expected fields
-                        'symbol_display': symbol_display,
-                        'type': f"{option_type} Option" if contract_type == 'OPT' else 'Stock',
-                        'strike': float(strike),
-                        'expiry': expiry,
-                        'dte': int(dte),
-                        'premium': float(abs(item.averageCost)) if contract_type == 'OPT' else 0,
-                        'pnl': float(round(pnl_pct, 1)),
-                        'delta': estimated_delta,  # Use calculated delta value
-                        'status': 'ROLLING' if pnl_pct < -25 else 'ACTIVE'
-                    }
+                    symbol_display = f"{contract.symbol} {option_type} ${strike}"
+                    contract_type = 'OPT'
+                else:
+                    strike = 0
+                    option_type = ''
+                    dte = 0
+                    expiry = '-'
+                    symbol_display = contract.symbol
+                    contract_type = 'STK'
+                
+                # Get LIVE delta from IBKR - NO FALLBACKS ALLOWED (using working pattern)
+                estimated_delta = None  # Must get live delta or None
+                if hasattr(contract, 'right') and contract.right != '0':  # Only for options
+                    # First, try to get delta DIRECTLY from portfolio item (like ibkr_delta_service.py does)
+                    if hasattr(item, 'modelGreeks') and item.modelGreeks and hasattr(item.modelGreeks, 'delta') and item.modelGreeks.delta is not None:
+                        # SUCCESS: Portfolio item already has live delta!
+                        estimated_delta = float(item.modelGreeks.delta)
+                        logger.info(f"✅ {contract.symbol}: Portfolio item has delta {estimated_delta:.3f}")
+                    else:
+                        # Use the delta service's published value; request the rest below in one batch
+                        estimated_delta = self._get_delta_from_cache(contract)
+                        if estimated_delta is None:
+                            pending_greeks.append((i, contract))
+                elif hasattr(contract, 'right') and contract.right == '0':  # Stock
+                    estimated_delta = None  # No delta for stocks
+                
+                print(f"🔍 {contract.symbol}: Calculated delta = {estimated_delta}")
+                
+                # Create position data with frontend-expected format
+                position_info = {
+                    # Raw IBKR data (preserved for backward compatibility)
+                    'symbol': contract.symbol,
+                    'position': item.position,
+                    'avgCost': item.averageCost,
+                    'marketValue': item.marketValue,
+                    'unrealizedPNL': item.unrealizedPNL,
+                    'contract_type': contract_type,
                     
-                    print(f"✅ Processed {contract.symbol}: P&L {pnl_pct:.1f}%")
-                    position_data.append(position_info)
+                    # Frontend-expected fields
+                    'symbol_display': symbol_display,
+                    'type': f"{option_type} Option" if contract_type == 'OPT' else 'Stock',
+                    'strike': float(strike),
+                    'expiry': expiry,
+                    'dte': int(dte),
+                    'premium': premium_column[i] if contract_type == 'OPT' else 0,
+                    'pnl': pnl_column[i],
+                    'delta': estimated_delta,  # Use calculated delta value
+                    'status': status_column[i]
+                }
+                
+                position_data.append(position_info)
+            
+            # Request all missing Greeks concurrently, each bounded so one stalled contract can't hold up the update
+            if pending_greeks:
+                deltas = await asyncio.gather(
+                    *(asyncio.wait_for(self._get_ibkr_delta_async(contract, 'OPT'), self.GREEKS_TIMEOUT)
+                      for _, contract in pending_greeks),
+                    return_exceptions=True
+                )
+                for (index, contract), delta_value in zip(pending_greeks, deltas):
+                    if isinstance(delta_value, Exception):
+                        logger.warning(f"⚠️ {contract.symbol}: no live delta ({delta_value!r})")
+                        continue
+                    position_data[index]['delta'] = delta_value
             
             print(f"✅ Successfully processed {len(position_data)} positions")
             
             # Cache the position data for Flask threads to use
             self.cached_positions_data = position_data
+            self.cached_positions_ts = time.monotonic()
+            self.positions_version += 1
             
             return position_data
             
@@ -5647,32 +5855,53 @@ class WheelDashboard:
             logger.error(f"❌ Error in _get_positions_async: {e}")
             raise RuntimeError(f"Failed to get positions from IBKR: {e}")
         
+    def positions_are_fresh(self):
+        """Check whether the cached positions are younger than POSITIONS_TTL"""
+        return (self.cached_positions_data is not None and
+                time.monotonic() - self.cached_positions_ts < self.POSITIONS_TTL)
+    
+    def request_positions_refresh(self):
+        """Schedule a positions refresh on the monitoring loop without blocking the caller"""
+        if self.loop is None or self.loop.is_closed():
+            return
+        if self._positions_refresh is not None and not self._positions_refresh.done():
+            return  # A refresh is already in flight
+        self._positions_refresh = asyncio.run_coroutine_threadsafe(self._refresh_positions_async(), self.loop)
+    
+    async def _refresh_positions_async(self):
+        """Refresh positions and publish them to the API cache"""
+        global current_positions
+        positions = await self._get_positions_async()
+        with _state_lock:
+            current_positions = positions
+        
     async def _get_opportunities_async(self):
         """Get new wheel opportunities asynchronously"""
         try:
             print("\nScanning for opportunities...")
             opportunities = await self.scanner.scan_opportunities_async()
-            print(f"Raw scanner results: {opportunities}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Raw scanner results: {opportunities}")
             
             # Format opportunities for display
-            formatted_opps = []
-            for opp in opportunities:
+            def format_opp(opp):
                 try:
-                    formatted_opp = {
+                    return {
                         'symbol': opp['symbol'],
                         'strike': float(opp['strike']),
                         'premium': float(opp['premium']),
                         'annual_return': float(opp['annual_return']) * 100,  # Convert to percentage
                         'score': round(float(opp.get('liquidity_score', 0)) / 100, 2)  # Normalize score
                     }
-                    print(f"Formatted opportunity: {json.dumps(formatted_opp, indent=2)}")
-                    formatted_opps.append(formatted_opp)
                 except Exception as e:
                     logger.error(f"Error formatting opportunity {opp}: {e}")
                     raise RuntimeError(f"Failed to format opportunity: {e}")
             
-            sorted_opps = sorted(formatted_opps, key=lambda x: x['annual_return'], reverse=True)
-            print(f"\nFinal opportunities: {json.dumps(sorted_opps, indent=2)}")
+            formatted_opps = [format_opp(opp) for opp in opportunities]
+            
+            sorted_opps = sorted(formatted_opps, key=_BY_ANNUAL_RETURN, reverse=True)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Final opportunities: {json.dumps(sorted_opps)}")
             return sorted_opps
         except Exception as e:
             logger.error(f"Error getting opportunities: {e}")
@@ -5704,55 +5933,44 @@ class WheelDashboard:
             
             qualified_contract = qualified_contracts[0]
             
-            # Request market data with Greeks asynchronously
-            ticker = self.monitor.ib.reqMktData(qualified_contract, '106', False, False)
-            
-            # Wait for Greeks to populate with async sleep
-            max_wait = 5.0  # 5 second timeout
-            wait_interval = 0.1
-            elapsed = 0
-            
-            while elapsed < max_wait:
-                await asyncio.sleep(wait_interval)
-                elapsed += wait_interval
-                
-                # Check if Greeks are available
-                if (hasattr(ticker, 'modelGreeks') and 
-                    ticker.modelGreeks and 
-                    ticker.modelGreeks.delta is not None):
-                    delta_value = float(ticker.modelGreeks.delta)
-                    # Cancel market data subscription
-                    self.monitor.ib.cancelMktData(qualified_contract)
-                    logger.info(f"✅ {contract.symbol}: LIVE IBKR delta {delta_value:.3f}")
-                    return delta_value
-            
-            # Timeout - cancel subscription and fail hard
-            self.monitor.ib.cancelMktData(qualified_contract)
-            raise TimeoutError(f"Failed to get Greeks for {contract.symbol} within {max_wait}s")
+            # Snapshot request resolves as soon as IBKR delivers the ticker, Greeks included
+            try:
+                tickers = await asyncio.wait_for(self.monitor.ib.reqTickersAsync(qualified_contract),
+                                                 timeout=self.GREEKS_TIMEOUT)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"Failed to get Greeks for {contract.symbol} within {self.GREEKS_TIMEOUT}s")
+            ticker = tickers[0] if tickers else None
+            if ticker is None or not ticker.modelGreeks or ticker.modelGreeks.delta is None:
+                raise ValueError(f"No Greeks in snapshot for {contract.symbol}")
+            
+            delta_value = float(ticker.modelGreeks.delta)
+            logger.info(f"✅ {contract.symbol}: LIVE IBKR delta {delta_value:.3f}")
+            return delta_value
             
         except Exception as e:
             logger.error(f"❌ {contract.symbol}: IBKR delta FAILED: {e}")
             raise RuntimeError(f"Failed to get IBKR delta for {contract.symbol}: {e}")
     
-    def _get_ibkr_delta(self, contract, contract_type):
-        """Sync wrapper for async delta retrieval - COMPLETELY DISABLED"""
-        # This method has been completely disabled to prevent event loop conflicts
-        # All delta calculations should use _get_ibkr_delta_async or _calculate_estimated_delta
-        # DO NOT CALL THIS METHOD - it will cause event loop conflicts
-        raise RuntimeError("_get_ibkr_delta has been completely disabled - use _get_ibkr_delta_async or _calculate_estimated_delta instead")
-
-    def _get_delta_from_cache(self, symbol):
-        """Get delta value from the background service cache"""
+    def _get_delta_from_cache(self, contract):
+        """Get an option contract's delta value from the background service cache"""
         try:
             import json
             from datetime import datetime, timedelta
             
             cache_file = 'delta_cache.json'
+            symbol = contract.symbol
+            key = _delta_cache_key(symbol, contract.strike, contract.lastTradeDateOrContractMonth, contract.right)
             
             # Check if cache file exists and is recent (less than 5 minutes old)
             try:
-                with open(cache_file, 'r') as f:
-                    data = json.load(f)
+                # The delta service replaces the file atomically, so an unchanged mtime means unchanged contents
+                mtime_ns = os.stat(cache_file).st_mtime_ns
+                if mtime_ns == self._delta_cache_mirror[0]:
+                    data = self._delta_cache_mirror[1]
+                else:
+                    with open(cache_file, 'r') as f:
+                        data = json.load(f)
+                    self._delta_cache_mirror = (mtime_ns, data)
                     
                 # Check timestamp
                 cache_time = datetime.fromisoformat(data.get('timestamp', ''))
@@ -5760,14 +5978,14 @@ class WheelDashboard:
                     logger.warning(f"⚠️ Delta cache is stale for {symbol}, using fallback")
                     return None
                 
-                # Get delta for this symbol
+                # Get delta for this contract
                 deltas = data.get('deltas', {})
-                if symbol in deltas:
-                    delta_value = deltas[symbol]
-                    logger.info(f"✅ {symbol}: Cached delta {delta_value:.3f}")
+                if key in deltas:
+                    delta_value = deltas[key]
+                    logger.info(f"✅ {key}: Cached delta {delta_value:.3f}")
                     return delta_value
                 else:
-                    logger.warning(f"⚠️ No cached delta found for {symbol}")
+                    logger.warning(f"⚠️ No cached delta found for {key}")
                     return None
                     
             except FileNotFoundError:
@@ -5781,110 +5999,19 @@ class WheelDashboard:
             logger.error(f"❌ Error in _get_delta_from_cache for {symbol}: {e}")
             return None
     
-    # REMOVED: _calculate_position_delta - function was broken and disabled
-    
-    # REMOVED: _calculate_estimated_delta - function was broken and no longer used
-        # Function body removed - was broken and unused
-            
-            # If we still don't have a stock price, try to estimate from option price
-            if stock_price is None and hasattr(contract, 'marketPrice') and contract.marketPrice:
-                option_price = abs(contract.marketPrice)
-                if contract.right == 'P':
-                    # For puts: stock price ≈ strike - (option_price * 2)
-                    stock_price = strike - (option_price * 2)
-                    stock_price = max(stock_price, strike * 0.7)
-                    stock_price = min(stock_price, strike * 1.3)
-                else:  # Calls
-                    # For calls: stock price ≈ strike + (option_price * 2)
-                    stock_price = strike + (option_price * 2)
-                    stock_price = max(stock_price, strike * 0.7)
-                    stock_price = min(stock_price, strike * 1.3)
-                logger.info(f"📊 Estimated stock price for {contract.symbol}: ${stock_price:.2f}")
-            
-            if stock_price is None:
-                # Final fallback to strike price
-                stock_price = strike
-                logger.warning(f"⚠️ Using strike price as fallback for {contract.symbol}: ${stock_price:.2f}")
-            
-            # Calculate estimated delta based on moneyness and time to expiry
-            moneyness = stock_price / strike
-            
-            # Get days to expiry for more accurate delta estimation
-            dte = 30  # Default to 30 days if we can't determine
-            if hasattr(contract, 'lastTradeDateOrContractMonth'):
-                try:
-                    expiry_date = datetime.strptime(contract.lastTradeDateOrContractMonth, '%Y%m%d')
-                    dte = (expiry_date - datetime.now()).days
-                    dte = max(dte, 1)  # Ensure positive
-                except:
-                    dte = 30
-            
-            # Calculate position-specific delta based on actual moneyness
-            if contract.right == 'C':  # Call option
-                if moneyness > 1.05:  # ITM
-                    delta = 0.8 + (moneyness - 1.05) * 0.4
-                elif moneyness > 0.95:  # Near ATM
-                    delta = 0.4 + (moneyness - 0.95) * 0.4
-                elif moneyness > 0.85:  # OTM
-                    delta = 0.2 + (moneyness - 0.85) * 0.2
-                else:  # Deep OTM
-                    delta = 0.1
-                
-                # Adjust for DTE - longer DTE means higher delta for ITM, lower for OTM
-                if dte < 7:
-                    delta *= 0.8  # Short-term options have lower deltas
-                elif dte > 45:
-                    delta *= 1.1  # Long-term options have higher deltas
-                    
-            else:  # Put option
-                if moneyness < 0.95:  # ITM
-                    delta = -0.8 - (0.95 - moneyness) * 0.4
-                elif moneyness < 1.05:  # Near ATM
-                    delta = -0.4 - (1.05 - moneyness) * 0.4
-                elif moneyness < 1.15:  # OTM
-                    delta = -0.2 - (1.15 - moneyness) * 0.2
-                else:  # Deep OTM
-                    delta = -0.1
-                
-                # Adjust for DTE - longer DTE means lower delta (more negative) for ITM
-                if dte < 7:
-                    delta *= 0.8  # Short-term options have higher deltas (less negative)
-                elif dte > 45:
-                    delta *= 1.1  # Long-term options have lower deltas (more negative)
-            
-            # Ensure delta is within reasonable bounds
-            if contract.right == 'C':
-                delta = max(0.01, min(0.99, delta))
-            else:
-                delta = max(-0.99, min(-0.01, delta))
-            
-            # Add some randomness to make deltas more realistic and varied
-            import random
-            random.seed(hash(f"{contract.symbol}{strike}{contract.right}") % 1000)
-            delta += random.uniform(-0.05, 0.05)
-            
-            logger.info(f"📊 {contract.symbol}: Estimated delta {delta:.3f} (price=${stock_price:.2f}, strike=${strike}, moneyness={moneyness:.3f}, DTE={dte}, type={contract.right})")
-            return delta
-                    
-        # Function removed - was broken and unused
-    
-
-
     def _get_metrics(self):
         """Get performance metrics"""
         try:
-            # Use cached account data to avoid event loop conflicts
-            # This prevents the "event loop is already running" error
             account_value = 122000  # Default value if IBKR data unavailable
             available_funds = 50000  # Default value
             
             try:
-                # Try to get live data, but don't fail if it causes event loop issues
-                account_summary = self.monitor.ib.accountSummary()
+                # Fetch live data on the monitoring loop, which owns the IBKR calls
+                account_summary = self.run_on_loop(self.monitor.ib.accountSummaryAsync(), timeout=self.ACCOUNT_SUMMARY_TIMEOUT)
                 account_value = float(next((item.value for item in account_summary if item.tag == 'NetLiquidation'), account_value))
                 available_funds = float(next((item.value for item in account_summary if item.tag == 'AvailableFunds'), available_funds))
             except Exception as e:
-                logger.warning(f"Using cached account data due to event loop conflict: {e}")
+                logger.warning(f"Using default account data, live summary unavailable: {e}")
                 # Use default values to keep dashboard functional
             
             # Get base metrics
@@ -5903,23 +6030,30 @@ class WheelDashboard:
         except Exception as e:
             logger.error(f"Error getting metrics: {e}")
             # Return basic metrics instead of failing completely
-            return {
-                'account_value': 122000,
-                'available_funds': 50000,
-                'cash_percentage': 41.0,
-                'positions_count': 0,
-                'daily_returns': 0,
-                'total_pnl': 0,
-                'win_rate': 0,
-                'max_drawdown': 0
-            }
+            return dict(self._FALLBACK_METRICS)
     
     def _get_alerts(self):
-        """Get active alerts"""
-        alerts = []
-        
+        """Get active alerts, rebuilt only when the underlying state changes"""
         # Get circuit breaker status
         cb_status = self.monitor.check_circuit_breaker()
+        
+        # Sector correlation pulls price history, so reuse it for CORRELATION_TTL seconds
+        now = time.monotonic()
+        if self._correlation is None or now - self._correlation_ts >= self.CORRELATION_TTL:
+            self._correlation = self.monitor.calculate_correlation()
+            self._correlation_ts = now
+        correlation = self._correlation
+        
+        consecutive_wins = self.monitor.win_streak_manager.consecutive_wins
+        black_swan = self.monitor.black_swan_protocol
+        
+        key = (cb_status['active'], cb_status['reason'], round(correlation, 2),
+               consecutive_wins, black_swan.active, black_swan.recovery_stage)
+        if key == self._alerts_cache_key:
+            return list(self._alerts_cache)
+        
+        alerts = []
+        
         if cb_status['active']:
             alerts.append({
                 'priority': 'CRITICAL',
@@ -5928,7 +6062,6 @@ class WheelDashboard:
             })
         
         # Get correlation warning
-        correlation = self.monitor.calculate_correlation()
         if correlation > self.monitor.thresholds['correlation_threshold']:
             alerts.append({
                 'priority': 'IMPORTANT',
@@ -5937,22 +6070,24 @@ class WheelDashboard:
             })
         
         # Get win streak warning
-        if self.monitor.win_streak_manager.consecutive_wins >= self.monitor.thresholds['win_streak_caution']:
+        if consecutive_wins >= self.monitor.thresholds['win_streak_caution']:
             alerts.append({
                 'priority': 'IMPORTANT',
                 'title': 'Win Streak Caution',
-                'message': f"Win streak at {self.monitor.win_streak_manager.consecutive_wins} consecutive wins"
+                'message': f"Win streak at {consecutive_wins} consecutive wins"
             })
         
         # Get Black Swan status
-        if self.monitor.black_swan_protocol.active:
+        if black_swan.active:
             alerts.append({
                 'priority': 'CRITICAL',
                 'title': 'Black Swan Protocol Active',
-                'message': f"Recovery stage: {self.monitor.black_swan_protocol.recovery_stage}/4"
+                'message': f"Recovery stage: {black_swan.recovery_stage}/4"
             })
         
-        return alerts
+        self._alerts_cache_key = key
+        self._alerts_cache = alerts
+        return list(alerts)
     
     def _get_position_status(self, position, ticker):
         """Determine position status based on various factors"""
@@ -5993,26 +6128,20 @@ class WheelDashboard:
             # Get recent trades from tracker
             trades = self.tracker.get_recent_trades(30)  # Last 30 trades
             
-            # Group trades by date and calculate daily P&L
-            daily_pnl = {}
-            for trade in trades:
-                date = trade.get('timestamp', datetime.now()).strftime('%Y-%m-%d')
-                pnl = trade.get('pnl', 0)
-                daily_pnl[date] = daily_pnl.get(date, 0) + pnl
+            # Group trades by day ordinal and sum daily P&L in one compiled pass
+            now = datetime.now()
+            days = np.array([trade.get('timestamp', now).toordinal() for trade in trades], dtype=np.int64)
+            pnls = np.array([trade.get('pnl', 0) for trade in trades], dtype=np.float64)
+            unique_days, daily_pnl = _njit_group_sum(days, pnls)
             
-            # Convert to list of date/return pairs
-            daily_returns = [
+            # Convert to list of date/return pairs, already sorted by date
+            return [
                 {
-                    'date': date,
+                    'date': date.fromordinal(int(day)).isoformat(),
                     'return': (pnl / self.monitor.account_value * 100)
                 }
-                for date, pnl in daily_pnl.items()
+                for day, pnl in zip(unique_days, daily_pnl.tolist())
             ]
-            
-            # Sort by date
-            daily_returns.sort(key=lambda x: x['date'])
-            
-            return daily_returns
         except Exception as e:
             logger.error(f"Error getting daily returns: {e}")
             raise RuntimeError(f"Failed to get daily returns for chart: {e}")
@@ -6034,59 +6163,64 @@ def status():
         'websocket_enabled': True
     })
 
+# Account snapshot from the IBKR logs, applied by /api/force-update
+# From the logs, we can see NetLiquidation: 89682.2913, CashBalance: 58885.44, etc.
+_FORCE_UPDATE_METRICS = {
+    'account_value': 89682.29,
+    'available_funds': 58885.44, 
+    'total_cash': 58885.44,
+    'unrealized_pnl': 12427.21,
+    'cash_percentage': (58885.44 / 89682.29 * 100),
+    'return_pct': (12427.21 / (89682.29 - 12427.21) * 100)
+}
+
+# Positions from the IBKR logs, applied by /api/force-update (read-only template)
+_FORCE_UPDATE_POSITIONS = (
+    {
+        'symbol': 'NVDA',
+        'position': 200,
+        'avgCost': 111.855282,
+        'marketValue': 34682.0,
+        'unrealizedPNL': 12310.94,
+        'contract_type': 'STK'
+    },
+    {
+        'symbol': 'DE',
+        'position': -1,
+        'avgCost': 1126.2036,
+        'marketValue': -625.33,
+        'unrealizedPNL': 500.87,
+        'contract_type': 'OPT'
+    },
+    {
+        'symbol': 'GOOG',
+        'position': -1,
+        'avgCost': 519.2236,
+        'marketValue': -97.88,
+        'unrealizedPNL': 421.35,
+        'contract_type': 'OPT'
+    },
+    {
+        'symbol': 'JPM',
+        'position': -1,
+        'avgCost': 113.2936,
+        'marketValue': -43.6,
+        'unrealizedPNL': 69.7,
+        'contract_type': 'OPT'
+    }
+)
+
 @app.route('/api/force-update')
 def force_update():
     """Force an update of the cached data"""
     try:
         global current_metrics, current_positions
         
-        # Update metrics based on what we see in the logs
-        # From the logs, we can see NetLiquidation: 89682.2913, CashBalance: 58885.44, etc.
-        current_metrics.update({
-            'account_value': 89682.29,
-            'available_funds': 58885.44, 
-            'total_cash': 58885.44,
-            'unrealized_pnl': 12427.21,
-            'cash_percentage': (58885.44 / 89682.29 * 100),
-            'return_pct': (12427.21 / (89682.29 - 12427.21) * 100),
-            'last_updated': datetime.now().isoformat()
-        })
-        
-        # Update positions based on what we see in the logs
-        current_positions = [
-            {
-                'symbol': 'NVDA',
-                'position': 200,
-                'avgCost': 111.855282,
-                'marketValue': 34682.0,
-                'unrealizedPNL': 12310.94,
-                'contract_type': 'STK'
-            },
-            {
-                'symbol': 'DE',
-                'position': -1,
-                'avgCost': 1126.2036,
-                'marketValue': -625.33,
-                'unrealizedPNL': 500.87,
-                'contract_type': 'OPT'
-            },
-            {
-                'symbol': 'GOOG',
-                'position': -1,
-                'avgCost': 519.2236,
-                'marketValue': -97.88,
-                'unrealizedPNL': 421.35,
-                'contract_type': 'OPT'
-            },
-            {
-                'symbol': 'JPM',
-                'position': -1,
-                'avgCost': 113.2936,
-                'marketValue': -43.6,
-                'unrealizedPNL': 69.7,
-                'contract_type': 'OPT'
-            }
-        ]
+        # Update metrics and positions based on what we see in the logs
+        with _state_lock:
+            current_metrics.update(_FORCE_UPDATE_METRICS)
+            current_metrics['last_updated'] = datetime.now().isoformat()
+            current_positions = list(_FORCE_UPDATE_POSITIONS)
         
         if current_metrics is None or current_positions is None:
             raise RuntimeError("No data available - IBKR connection required")
@@ -6098,12 +6232,40 @@ def force_update():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+# Position recommendations, shared by every /api/positions row that needs them
+ROLL_URGENT = sys.intern('URGENT: Roll to next month (DTE < 7)')
+ROLL_SOON = sys.intern('Consider rolling to next month (DTE < 14)')
+ROLL_HIGH_DELTA = sys.intern('Consider rolling to lower delta (High risk)')
+ROLL_MONITOR_DELTA = sys.intern('Monitor delta - may need adjustment')
+CLOSE_STRONG_PROFIT = sys.intern('Strong profit - Consider closing (50%+ gain)')
+CLOSE_GOOD_PROFIT = sys.intern('Good profit - Monitor for exit (25%+ gain)')
+CLOSE_LIMIT_LOSS = sys.intern('Consider closing to limit losses (-25%+)')
+CLOSE_MONITOR_LOSS = sys.intern('Monitor closely - approaching loss threshold')
+ROLL_MESSAGES = (ROLL_URGENT, ROLL_SOON, ROLL_HIGH_DELTA, ROLL_MONITOR_DELTA, None)
+CLOSE_MESSAGES = (CLOSE_STRONG_PROFIT, CLOSE_GOOD_PROFIT, CLOSE_LIMIT_LOSS, CLOSE_MONITOR_LOSS, None)
+
+# DTE buckets shared by color coding, roll urgency and DTE creep scoring
+# 0: < 7 days, 1: < 14, 2: < 21, 3: < 30, 4: 30+ or unknown
+DTE_BINS = np.array([7.0, 14.0, 21.0, 30.0])
+DTE_BUCKET_COLORS = ('red', 'yellow', 'white', 'white', 'white')
+
+# Serialized /api/positions body, reused while polls arrive within POSITIONS_RESPONSE_TTL
+POSITIONS_RESPONSE_TTL = 2.0
+_positions_response = {'ts': 0.0, 'source': None, 'payload': None}
+
 @app.route('/api/positions')
 def get_positions():
     """Get current positions"""
     try:
         global current_positions
         
+        # Repeated polls of an unchanged positions list reuse the serialized body
+        cached = _positions_response
+        if (cached['payload'] is not None and cached['source'] is current_positions
+                and time.monotonic() - cached['ts'] < POSITIONS_RESPONSE_TTL
+                and not request.cache_control.no_cache):
+            return app.response_class(cached['payload'], mimetype='application/json')
+        
         # If no cached positions, try to get them directly from IBKR
         if current_positions is None:
             if dashboard and dashboard.monitor and dashboard.monitor.ib and dashboard.monitor.ib.isConnected():
@@ -6111,179 +6273,182 @@ def get_positions():
                 try:
                     # Get portfolio items directly from IBKR
                     portfolio_items = dashboard.monitor.ib.portfolio()
-                    positions = []
+                    today = date.today()
+                    held = [item for item in portfolio_items if item.position != 0]  # Only include non-zero positions
+                    n = len(held)
+                    # One array per field (filled in a single pass), assembled into a DataFrame below
+                    symbols = np.empty(n, dtype=object)
+                    display_types = np.empty(n, dtype=object)
+                    strikes = np.empty(n, dtype=object)
+                    expiries = np.empty(n, dtype=object)
+                    rights = np.empty(n, dtype=object)
+                    sizes = np.empty(n)
+                    avg_costs = np.empty(n)
+                    market_prices = np.empty(n)
+                    market_values = np.empty(n)
+                    unrealized = np.empty(n)
+                    realized = np.empty(n)
+                    premiums = np.full(n, np.nan)
+                    stock_price_col = np.full(n, np.nan)
+                    dtes = np.full(n, np.nan)
+                    deltas = np.full(n, np.nan)
+                    is_stock = np.zeros(n, dtype=bool)
+                    is_option = np.zeros(n, dtype=bool)
                     
-                    for item in portfolio_items:
-                        if item.position != 0:  # Only include non-zero positions
-                            contract = item.contract
-                            # Calculate DTE (Days to Expiry) and format expiry date
-                            dte = None
-                            formatted_expiry = None
-                            if hasattr(contract, 'lastTradeDateOrContractMonth') and contract.lastTradeDateOrContractMonth:
-                                try:
-                                    expiry_date = datetime.strptime(contract.lastTradeDateOrContractMonth, '%Y%m%d')
-                                    dte = (expiry_date - datetime.now()).days
-                                    formatted_expiry = expiry_date.strftime('%b %d, %Y')  # e.g., "Aug 15, 2025"
-                                except:
-                                    dte = None
-                                    formatted_expiry = contract.lastTradeDateOrContractMonth
-                            
-                            # Calculate P&L percentage (different for stocks vs options)
-                            pnl_pct = None
-                            if item.averageCost != 0:
-                                if hasattr(contract, 'right') and contract.right == '0':  # Stock
-                                    # For stocks: P&L% = (current_price - avg_cost) / avg_cost * 100
-                                    current_price = item.marketPrice
-                                    pnl_pct = round(((current_price - item.averageCost) / item.averageCost) * 100, 1)
-                                else:  # Options
-                                    # For options: P&L% = unrealized_pnl / abs(avg_cost) * 100
-                                    pnl_pct = round((item.unrealizedPNL / abs(item.averageCost)) * 100, 1)
-                            
-                            # Determine option type for display with position direction
-                            option_display_type = None
-                            if hasattr(contract, 'right'):
-                                if contract.right == 'P':
-                                    option_display_type = 'CSP' if item.position < 0 else 'BOUGHT PUT'
-                                elif contract.right == 'C':
-                                    option_display_type = 'CC' if item.position < 0 else 'BOUGHT CALL'
-                                elif contract.right == '0':
-                                    option_display_type = 'STOCK'
-                            
-                            # Determine stock price and premium based on position type
-                            if hasattr(contract, 'right') and contract.right == '0':  # Stock
-                                stock_price = item.marketPrice
-                                premium = None  # No premium for stocks
-                            else:  # Option
-                                # Use actual stock prices from IBKR data when available
-                                # These are the real stock prices we see in the logs
-                                stock_prices = {
-                                    'DE': 514.5,
-                                    'GOOG': 189.0, 
-                                    'JPM': 283.5,
-                                    'NVDA': 183.3,
-                                    'UNH': 270.0,
-                                    'WMT': 94.0,
-                                    'XOM': 110.0
-                                }
-                                
-                                if contract.symbol in stock_prices:
-                                    stock_price = stock_prices[contract.symbol]
-                                else:
-                                    # Fallback to estimation if symbol not in our data
-                                    if hasattr(contract, 'strike'):
-                                        if contract.right == 'P':  # Put
-                                            stock_price = contract.strike * 1.05  # Rough estimate
-                                        else:  # Call
-                                            stock_price = contract.strike * 0.98  # Rough estimate
-                                    else:
-                                        stock_price = None
-                                premium = item.marketPrice
-                            
-                            # Calculate DTE color coding
-                            dte_color = 'white'  # Default for stocks or unknown DTE
-                            if dte is not None:
-                                if dte < 7:
-                                    dte_color = 'red'
-                                elif dte < 14:
-                                    dte_color = 'yellow'
-                                else:
-                                    dte_color = 'white'
-                            
-                            # Get LIVE delta from IBKR - NO FALLBACKS ALLOWED
-                            estimated_delta = None  # Must get live delta or None
-                            if hasattr(contract, 'right') and contract.right != '0':  # Only for options
-                                # First, try to get delta DIRECTLY from portfolio item (like ibkr_delta_service.py does)
-                                if hasattr(item, 'modelGreeks') and item.modelGreeks and hasattr(item.modelGreeks, 'delta') and item.modelGreeks.delta is not None:
-                                    # SUCCESS: Portfolio item already has live delta!
-                                    estimated_delta = float(item.modelGreeks.delta)
-                                    logger.info(f"✅ {contract.symbol}: Portfolio item has delta {estimated_delta:.3f}")
-                                else:
+                    for i, item in enumerate(held):
+                        contract = item.contract
+                        # Read each contract/item attribute once
+                        symbol = contract.symbol
+                        right = getattr(contract, 'right', None)
+                        strike = getattr(contract, 'strike', None)
+                        expiry = getattr(contract, 'lastTradeDateOrContractMonth', None)
+                        pos = item.position
+                        mp = item.marketPrice
+                        
+                        symbols[i] = symbol
+                        strikes[i] = strike
+                        expiries[i] = expiry
+                        rights[i] = right
+                        sizes[i] = pos
+                        avg_costs[i] = item.averageCost
+                        market_prices[i] = mp
+                        market_values[i] = item.marketValue
+                        unrealized[i] = item.unrealizedPNL
+                        realized[i] = item.realizedPNL
+                        
+                        # Stocks carry no expiry, premium or delta - skip the option-only work
+                        if right == '0':
+                            display_types[i] = 'STOCK'
+                            stock_price_col[i] = mp
+                            is_stock[i] = True
+                            continue
+                        
+                        # Calculate DTE (Days to Expiry) and format expiry date
+                        if expiry:
+                            try:
+                                expiry_date = _parse_yyyymmdd(expiry)
+                                dtes[i] = (expiry_date - today).days
+                                expiries[i] = expiry_date.strftime('%b %d, %Y')  # e.g., "Aug 15, 2025"
+                            except (TypeError, ValueError):
+                                pass
+                        
+                        # Determine option type for display with position direction
+                        if right == 'P':
+                            display_types[i] = 'CSP' if pos < 0 else 'BOUGHT PUT'
+                        elif right == 'C':
+                            display_types[i] = 'CC' if pos < 0 else 'BOUGHT CALL'
+                        
+                        # Use actual stock prices from IBKR data when available
+                        if symbol in _REFERENCE_STOCK_PRICES:
+                            stock_price_col[i] = _REFERENCE_STOCK_PRICES[symbol]
+                        elif strike is not None:
+                            # Fallback to estimation if symbol not in our data
+                            stock_price_col[i] = strike * (1.05 if right == 'P' else 0.98)  # Rough estimate
+                        premiums[i] = mp
+                        
+                        # Get LIVE delta from IBKR - NO FALLBACKS ALLOWED
+                        if right is not None:
+                            # First, try to get delta DIRECTLY from portfolio item (like ibkr_delta_service.py does)
+                            greeks = getattr(item, 'modelGreeks', None)
+                            greek_delta = getattr(greeks, 'delta', None) if greeks else None
+                            if greek_delta is not None:
+                                # SUCCESS: Portfolio item already has live delta!
+                                estimated_delta = float(greek_delta)
+                                logger.info(f"✅ {symbol}: Portfolio item has delta {estimated_delta:.3f}")
+                            else:
+                                # Use the delta service's published value before opening a duplicate subscription
+                                estimated_delta = dashboard._get_delta_from_cache(contract)
+                                if estimated_delta is None:
                                     # Try SYNCHRONOUS Greeks request using threading approach
                                     estimated_delta = _get_delta_from_ibkr(dashboard.monitor.ib, contract, logger)
-                            elif hasattr(contract, 'right') and contract.right == '0':  # Stock
-                                estimated_delta = None  # No delta for stocks
-                            
-                            # Calculate Delta risk thresholds
-                            delta_risk = 'low'  # Default
-                            
-                            # Generate automatic roll recommendations
-                            roll_recommendation = None
-                            close_recommendation = None
-                            if hasattr(contract, 'right') and contract.right != '0':  # Only for options
-                                if dte is not None and dte < 7:
-                                    roll_recommendation = 'URGENT: Roll to next month (DTE < 7)'
-                                elif dte is not None and dte < 14:
-                                    roll_recommendation = 'Consider rolling to next month (DTE < 14)'
-                                elif estimated_delta is not None and abs(estimated_delta) > 0.50:
-                                    roll_recommendation = 'Consider rolling to lower delta (High risk)'
-                                elif estimated_delta is not None and abs(estimated_delta) > 0.30:
-                                    roll_recommendation = 'Monitor delta - may need adjustment'
-                                
-                                # Generate close recommendations based on P&L
-                                if pnl_pct is not None:
-                                    if pnl_pct >= 50:
-                                        close_recommendation = 'Strong profit - Consider closing (50%+ gain)'
-                                    elif pnl_pct >= 25:
-                                        close_recommendation = 'Good profit - Monitor for exit (25%+ gain)'
-                                    elif pnl_pct <= -25:
-                                        close_recommendation = 'Consider closing to limit losses (-25%+)'
-                                    elif pnl_pct <= -10:
-                                        close_recommendation = 'Monitor closely - approaching loss threshold'
-                            # Determine risk level based on absolute delta value (only for options)
                             if estimated_delta is not None:
-                                abs_delta = abs(estimated_delta)
-                                if abs_delta > 0.50:
-                                    delta_risk = 'high'
-                                elif abs_delta > 0.30:
-                                    delta_risk = 'medium'
-                                else:
-                                    delta_risk = 'low'
-                            else:
-                                delta_risk = 'none'  # No delta risk for stocks
-                            
-                            position_data = {
-                                'symbol': contract.symbol,
-                                'type': option_display_type,
-                                'strike': getattr(contract, 'strike', None),
-                                'expiry': formatted_expiry or getattr(contract, 'lastTradeDateOrContractMonth', None),
-                                'dte': dte,
-                                'dte_color': dte_color,  # Color coding for DTE
-                                'delta_risk': delta_risk,  # Risk level based on delta
-                                'estimated_delta': estimated_delta,  # Estimated delta value
-                                'roll_recommendation': roll_recommendation,  # Automatic roll recommendation
-                                'close_recommendation': close_recommendation,  # Close recommendation based on P&L
-                                'premium': premium,
-                                'pnl': pnl_pct,
-                                'delta': estimated_delta,  # Use calculated delta value
-                                'status': 'Active',
-                                'quantity': abs(item.position),  # Number of contracts/shares
-                                'underlying_price': item.marketPrice,  # Current price (same as premium for now)
-                                'stock_price': stock_price,  # Actual stock price for options, stock price for stocks
-                                # Additional fields for backend use
-                                'position': item.position,
-                                'market_value': item.marketValue,
-                                'unrealized_pnl': item.unrealizedPNL,
-                                'realized_pnl': item.realizedPNL,
-                                'average_cost': item.averageCost,
-                                'market_price': item.marketPrice,
-                                'contract_type': 'STOCK' if hasattr(contract, 'right') and contract.right == '0' else 'OPTION',
-                                'option_type': getattr(contract, 'right', None),
-                                'sector': 'Unknown'
-                            }
-                            positions.append(position_data)
+                                deltas[i] = estimated_delta
+                            is_option[i] = True
+                    
+                    # Derived columns computed over all positions at once
+                    # P&L%: (price - cost) / cost for stocks, unrealized / |cost| for options
+                    has_cost = avg_costs != 0
+                    with np.errstate(divide='ignore', invalid='ignore'):
+                        pnl_pct = np.round(np.where(is_stock,
+                                                    (market_prices - avg_costs) / avg_costs,
+                                                    unrealized / np.abs(avg_costs)) * 100, 1)
+                    
+                    # Bucket DTE once (NaN lands in the last bucket) for color coding and roll urgency
+                    dte_bucket = np.digitize(dtes, DTE_BINS)
+                    dte_color = [DTE_BUCKET_COLORS[b] for b in dte_bucket.tolist()]
+                    
+                    # Generate automatic roll and close recommendations (options only)
+                    abs_delta = np.abs(deltas)
+                    roll_bucket = np.select(
+                        [is_option & (dte_bucket == 0),
+                         is_option & (dte_bucket == 1),
+                         is_option & (abs_delta > 0.50),
+                         is_option & (abs_delta > 0.30)],
+                        [0, 1, 2, 3], default=4)
+                    roll_recommendation = [ROLL_MESSAGES[b] for b in roll_bucket.tolist()]
+                    priced = is_option & has_cost
+                    close_bucket = np.select(
+                        [priced & (pnl_pct >= 50),
+                         priced & (pnl_pct >= 25),
+                         priced & (pnl_pct <= -25),
+                         priced & (pnl_pct <= -10)],
+                        [0, 1, 2, 3], default=4)
+                    close_recommendation = [CLOSE_MESSAGES[b] for b in close_bucket.tolist()]
+                    
+                    # Determine risk level based on absolute delta value (only for options)
+                    delta_risk = np.select([np.isnan(deltas), abs_delta > 0.50, abs_delta > 0.30],
+                                           ['none', 'high', 'medium'], default='low')
+                    
+                    df = pd.DataFrame({
+                        'symbol': symbols,
+                        'type': display_types,
+                        'strike': strikes,
+                        'expiry': expiries,
+                        'dte': pd.array(dtes, dtype='Int64'),
+                        'dte_color': dte_color,  # Color coding for DTE
+                        'delta_risk': delta_risk,  # Risk level based on delta
+                        'estimated_delta': deltas,  # Estimated delta value
+                        'roll_recommendation': roll_recommendation,  # Automatic roll recommendation
+                        'close_recommendation': close_recommendation,  # Close recommendation based on P&L
+                        'premium': premiums,
+                        'pnl': np.where(has_cost, pnl_pct, np.nan),
+                        'delta': deltas,  # Use calculated delta value
+                        'status': 'Active',
+                        'quantity': np.abs(sizes),  # Number of contracts/shares
+                        'underlying_price': market_prices,  # Current price (same as premium for now)
+                        'stock_price': stock_price_col,  # Actual stock price for options, stock price for stocks
+                        # Additional fields for backend use
+                        'position': sizes,
+                        'market_value': market_values,
+                        'unrealized_pnl': unrealized,
+                        'realized_pnl': realized,
+                        'average_cost': avg_costs,
+                        'market_price': market_prices,
+                        'contract_type': np.where(is_stock, 'STOCK', 'OPTION'),
+                        'option_type': rights,
+                        'sector': 'Unknown'
+                    })
+                    # Records only at the JSON boundary, with missing values as None
+                    positions = df.astype(object).where(df.notna(), None).to_dict('records')
                     
                     # Cache the positions
                     current_positions = positions
                     logger.info(f"✅ Successfully fetched {len(positions)} positions from IBKR")
-                    return jsonify(positions)
+                    return ojsonify(positions)
                 except Exception as e:
                     logger.error(f"Error fetching positions from IBKR: {e}")
                     return jsonify({'error': f"Failed to fetch positions: {e}"}), 500
             else:
                 raise RuntimeError("No position data available - IBKR data required")
         
+        # Serve the monitor loop's positions and refresh them in the background once stale
+        if not dashboard.positions_are_fresh():
+            dashboard.request_positions_refresh()
         logger.info("Returning cached positions...")
-        return jsonify(current_positions)
+        positions = current_positions
+        response = ojsonify(positions)
+        _positions_response.update(ts=time.monotonic(), source=positions, payload=response.get_data())
+        return response
     except Exception as e:
         logger.error(f"Error getting positions: {e}")
         return jsonify({'error': str(e)}), 500
@@ -6292,7 +6457,7 @@ def get_positions():
 def get_metrics():
     try:
         logger.info("Returning cached metrics...")
-        return jsonify(current_metrics)
+        return ojsonify(current_metrics)
     except Exception as e:
         logger.error(f"Error getting metrics: {e}")
         return jsonify({
@@ -6323,6 +6488,8 @@ def get_premium_tracking():
         monthly_premium_target = account_value * 0.005  # 0.5% of capital
         daily_premium_target = monthly_premium_target / 21  # Assuming 21 trading days per month
         
+        current_date = datetime.now()
+        
         # Calculate premium collection from actual closed positions this month
         try:
             if hasattr(dashboard, 'tracker') and dashboard.tracker:
@@ -6332,14 +6499,15 @@ def get_premium_tracking():
                 closed_trades = dashboard.tracker.get_closed_trades_for_month(current_year, current_month)
                 
                 # Filter for option trades and calculate premium collected
-                option_trades = [trade for trade in closed_trades if trade.get('type') in ['PUT', 'CALL']]
-                mtd_premium_collected = sum(trade.get('premium', 0) * trade.get('quantity', 1) for trade in option_trades)
+                trades = pd.DataFrame(closed_trades, columns=['type', 'premium', 'quantity', 'close_date'])
+                option_trades = trades[trades['type'].isin(('PUT', 'CALL'))]
+                gross = option_trades['premium'].fillna(0) * option_trades['quantity'].fillna(1)
+                mtd_premium_collected = float(gross.sum())
                 
                 # Calculate today's premium (from trades closed today)
                 today = current_date.date()
-                todays_trades = [trade for trade in option_trades 
-                               if trade.get('close_date') and trade.get('close_date').date() == today]
-                todays_premium = sum(trade.get('premium', 0) * trade.get('quantity', 1) for trade in todays_trades)
+                closed_today = pd.to_datetime(option_trades['close_date']).dt.date == today
+                todays_premium = float(gross[closed_today].sum())
                 
                 # Calculate premium from current open positions (unrealized)
                 try:
@@ -6363,13 +6531,7 @@ def get_premium_tracking():
         daily_progress = (todays_premium / daily_premium_target * 100) if daily_premium_target > 0 else 0
         
         # Calculate days remaining in month
-        current_date = datetime.now()
-        if current_date.month == 12:
-            next_month = current_date.replace(year=current_date.year + 1, month=1, day=1)
-        else:
-            next_month = current_date.replace(month=current_date.month + 1, day=1)
-        
-        days_remaining = (next_month - current_date).days
+        days_remaining = _days_left_in_month(current_date.date())
         
         # Calculate premium collection rate
         trading_days_elapsed = 21 - days_remaining
@@ -6398,7 +6560,7 @@ def get_premium_tracking():
         }
         
         logger.info(f"✅ Premium tracking: ${mtd_premium_collected:.0f} / ${monthly_premium_target:.0f} MTD")
-        return jsonify(premium_data)
+        return ojsonify(premium_data)
         
     except Exception as e:
         logger.error(f"Error getting premium tracking data: {e}")
@@ -6469,7 +6631,7 @@ def get_correlation_monitoring():
         }
         
         logger.info(f"✅ Correlation monitoring: {correlation:.2f} ({risk_level})")
-        return jsonify(correlation_data)
+        return ojsonify(correlation_data)
         
     except Exception as e:
         logger.error(f"Error getting correlation monitoring data: {e}")
@@ -6490,11 +6652,13 @@ def get_risk_creep_detection():
                 # Get positions for analysis
                 positions = dashboard.get_positions() if hasattr(dashboard, 'get_positions') else []
                 
-                # Calculate risk creep metrics
-                dte_creep = _analyze_dte_creep(positions)
-                delta_creep = _analyze_delta_creep(positions)
-                size_creep = _analyze_size_creep(positions)
-                liquidity_creep = _analyze_liquidity_creep(positions)
+                # Calculate risk creep metrics over one shared frame
+                df = _creep_frame(positions)
+                df_opts = df[df['contract_type'] == 'OPTION']
+                dte_creep = _analyze_dte_creep(df_opts)
+                delta_creep = _analyze_delta_creep(df_opts)
+                size_creep = _analyze_size_creep(df)
+                liquidity_creep = _analyze_liquidity_creep(df)
                 
                 # Overall risk assessment
                 total_risk_score = _calculate_overall_risk_score(dte_creep, delta_creep, size_creep, liquidity_creep)
@@ -6537,125 +6701,128 @@ def get_risk_creep_detection():
         }
         
         logger.info(f"✅ Risk creep detection: {total_risk_score:.0f}% ({risk_level})")
-        return jsonify(risk_creep_data)
+        return ojsonify(risk_creep_data)
         
     except Exception as e:
         logger.error(f"Error getting risk creep detection data: {e}")
         return jsonify({'error': str(e)}), 500
 
-def _analyze_dte_creep(positions):
+_CREEP_COLUMNS = ['contract_type', 'dte', 'delta', 'quantity', 'symbol']
+
+# Liquid vs illiquid symbols (simplified)
+LIQUID_SYMBOLS = frozenset({'SPY', 'QQQ', 'IWM', 'AAPL', 'MSFT', 'GOOG', 'AMZN', 'NVDA', 'TSLA', 'META'})
+
+# Score, severity label and note for each creep tier, from worst (0) to best (4)
+_DTE_CREEP_TIERS = (
+    (100, 'CRITICAL', 'too short'),
+    (75, 'HIGH', 'shortening trend'),
+    (50, 'MODERATE', 'monitor'),
+    (25, 'LOW', 'acceptable'),
+    (0, 'GOOD', 'safe range')
+)
+_DELTA_CREEP_TIERS = (
+    (100, 'CRITICAL', 'too high risk'),
+    (75, 'HIGH', 'increasing risk'),
+    (50, 'MODERATE', 'monitor'),
+    (25, 'LOW', 'acceptable'),
+    (0, 'GOOD', 'safe range')
+)
+_SIZE_CREEP_TIERS = (
+    (100, 'CRITICAL', 'too large'),
+    (75, 'HIGH', 'increasing'),
+    (50, 'MODERATE', 'monitor'),
+    (25, 'LOW', 'acceptable'),
+    (0, 'GOOD', 'safe')
+)
+_LIQUIDITY_CREEP_TIERS = ((100, 'CRITICAL'), (75, 'HIGH'), (50, 'MODERATE'), (25, 'LOW'), (0, 'GOOD'))
+
+# Tier thresholds, worst first: DTE is worse below them, the others above
+_DTE_CREEP_THRESHOLDS = DTE_BINS
+_DELTA_CREEP_THRESHOLDS = np.array([0.50, 0.40, 0.30, 0.20])
+_SIZE_CREEP_THRESHOLDS = np.array([10.0, 5.0, 3.0, 1.0])
+_LIQUIDITY_CREEP_THRESHOLDS = np.array([50.0, 30.0, 20.0, 10.0])
+
+def _creep_tier(value, thresholds, higher_is_worse=True):
+    """Risk tier of a single aggregate via the batch tier kernel"""
+    return int(_njit_tier_index(np.array([value], dtype=np.float64), thresholds, higher_is_worse)[0])
+
+def _creep_frame(positions):
+    """Build the column frame shared by the risk creep analyzers"""
+    df = pd.DataFrame(positions, columns=_CREEP_COLUMNS)
+    for column in ('dte', 'delta', 'quantity'):
+        df[column] = pd.to_numeric(df[column], errors='coerce')
+    return df
+
+def _analyze_dte_creep(df_opts):
     """Analyze if we're entering shorter expirations over time"""
     try:
-        # Get current positions with DTE data
-        current_dtes = []
-        for pos in positions:
-            if pos.get('contract_type') == 'OPTION' and pos.get('dte'):
-                current_dtes.append(pos['dte'])
+        # Get current option positions with DTE data
+        dtes = df_opts['dte']
+        current_dtes = dtes[dtes.notna() & (dtes != 0)]
         
-        if not current_dtes:
+        if current_dtes.empty:
             return {'detected': False, 'score': 0, 'message': 'No option positions to analyze'}
         
-        avg_dte = sum(current_dtes) / len(current_dtes)
+        avg_dte = float(current_dtes.mean())
         
         # Risk assessment based on average DTE
-        if avg_dte < 7:
-            score = 100
-            message = f'CRITICAL: Average DTE {avg_dte:.0f} days - too short'
-        elif avg_dte < 14:
-            score = 75
-            message = f'HIGH: Average DTE {avg_dte:.0f} days - shortening trend'
-        elif avg_dte < 21:
-            score = 50
-            message = f'MODERATE: Average DTE {avg_dte:.0f} days - monitor'
-        elif avg_dte < 30:
-            score = 25
-            message = f'LOW: Average DTE {avg_dte:.0f} days - acceptable'
-        else:
-            score = 0
-            message = f'GOOD: Average DTE {avg_dte:.0f} days - safe range'
+        tier = _creep_tier(avg_dte, _DTE_CREEP_THRESHOLDS, higher_is_worse=False)
+        score, label, note = _DTE_CREEP_TIERS[tier]
+        message = f'{label}: Average DTE {avg_dte:.0f} days - {note}'
         
         return {
             'detected': score > 50,
             'score': score,
             'message': message,
             'average_dte': avg_dte,
-            'position_count': len(current_dtes)
+            'position_count': int(current_dtes.size)
         }
     except Exception as e:
         return {'detected': False, 'score': 0, 'message': f'Error analyzing DTE: {e}'}
 
-def _analyze_delta_creep(positions):
+def _analyze_delta_creep(df_opts):
     """Analyze if we're taking higher-risk strikes over time"""
     try:
-        # Get current positions with delta data
-        current_deltas = []
-        for pos in positions:
-            if pos.get('contract_type') == 'OPTION' and pos.get('delta') is not None:
-                current_deltas.append(abs(pos['delta']))
+        # Get current option positions with delta data
+        current_deltas = df_opts['delta'].dropna().abs()
         
-        if not current_deltas:
+        if current_deltas.empty:
             return {'detected': False, 'score': 0, 'message': 'No option positions to analyze'}
         
-        avg_delta = sum(current_deltas) / len(current_deltas)
+        avg_delta = float(current_deltas.mean())
         
         # Risk assessment based on average delta
-        if avg_delta > 0.50:
-            score = 100
-            message = f'CRITICAL: Average delta {avg_delta:.2f} - too high risk'
-        elif avg_delta > 0.40:
-            score = 75
-            message = f'HIGH: Average delta {avg_delta:.2f} - increasing risk'
-        elif avg_delta > 0.30:
-            score = 50
-            message = f'MODERATE: Average delta {avg_delta:.2f} - monitor'
-        elif avg_delta > 0.20:
-            score = 25
-            message = f'LOW: Average delta {avg_delta:.2f} - acceptable'
-        else:
-            score = 0
-            message = f'GOOD: Average delta {avg_delta:.2f} - safe range'
+        tier = _creep_tier(avg_delta, _DELTA_CREEP_THRESHOLDS)
+        score, label, note = _DELTA_CREEP_TIERS[tier]
+        message = f'{label}: Average delta {avg_delta:.2f} - {note}'
         
         return {
             'detected': score > 50,
             'score': score,
             'message': message,
             'average_delta': avg_delta,
-            'position_count': len(current_deltas)
+            'position_count': int(current_deltas.size)
         }
     except Exception as e:
         return {'detected': False, 'score': 0, 'message': f'Error analyzing delta: {e}'}
 
-def _analyze_size_creep(positions):
+def _analyze_size_creep(df):
     """Analyze if we're increasing position sizes over time"""
     try:
         # Get current position sizes
-        position_sizes = []
-        for pos in positions:
-            if pos.get('quantity'):
-                position_sizes.append(pos['quantity'])
+        quantities = df['quantity']
+        position_sizes = quantities[quantities.notna() & (quantities != 0)]
         
-        if not position_sizes:
+        if position_sizes.empty:
             return {'detected': False, 'score': 0, 'message': 'No positions to analyze'}
         
-        avg_size = sum(position_sizes) / len(position_sizes)
-        max_size = max(position_sizes) if position_sizes else 0
+        avg_size = float(position_sizes.mean())
+        max_size = position_sizes.max().item()
         
         # Risk assessment based on position sizes
-        if max_size > 10:
-            score = 100
-            message = f'CRITICAL: Max position size {max_size} - too large'
-        elif max_size > 5:
-            score = 75
-            message = f'HIGH: Max position size {max_size} - increasing'
-        elif max_size > 3:
-            score = 50
-            message = f'MODERATE: Max position size {max_size} - monitor'
-        elif max_size > 1:
-            score = 25
-            message = f'LOW: Max position size {max_size} - acceptable'
-        else:
-            score = 0
-            message = f'GOOD: Max position size {max_size} - safe'
+        tier = _creep_tier(max_size, _SIZE_CREEP_THRESHOLDS)
+        score, label, note = _SIZE_CREEP_TIERS[tier]
+        message = f'{label}: Max position size {max_size} - {note}'
         
         return {
             'detected': score > 50,
@@ -6663,41 +6830,30 @@ def _analyze_size_creep(positions):
             'message': message,
             'average_size': avg_size,
             'max_size': max_size,
-            'position_count': len(position_sizes)
+            'position_count': int(position_sizes.size)
         }
     except Exception as e:
         return {'detected': False, 'score': 0, 'message': f'Error analyzing size: {e}'}
 
-def _analyze_liquidity_creep(positions):
+def _analyze_liquidity_creep(df):
     """Analyze if we're trading less liquid names over time"""
     try:
         # Get symbols and assess liquidity
-        symbols = [pos.get('symbol') for pos in positions if pos.get('symbol')]
+        symbols = df['symbol']
+        symbols = symbols[symbols.notna() & (symbols != '')]
         
-        if not symbols:
+        if symbols.empty:
             return {'detected': False, 'score': 0, 'message': 'No positions to analyze'}
         
-        # Define liquid vs illiquid symbols (simplified)
-        liquid_symbols = ['SPY', 'QQQ', 'IWM', 'AAPL', 'MSFT', 'GOOG', 'AMZN', 'NVDA', 'TSLA', 'META']
-        illiquid_count = sum(1 for symbol in symbols if symbol not in liquid_symbols)
-        illiquid_percentage = (illiquid_count / len(symbols)) * 100 if symbols else 0
+        # Test liquidity once per distinct symbol, weighted by how often it is held
+        counts = symbols.value_counts()
+        illiquid_count = int(counts[~counts.index.isin(LIQUID_SYMBOLS)].sum())
+        illiquid_percentage = (illiquid_count / len(symbols)) * 100
         
         # Risk assessment based on illiquid percentage
-        if illiquid_percentage > 50:
-            score = 100
-            message = f'CRITICAL: {illiquid_percentage:.0f}% illiquid positions'
-        elif illiquid_percentage > 30:
-            score = 75
-            message = f'HIGH: {illiquid_percentage:.0f}% illiquid positions'
-        elif illiquid_percentage > 20:
-            score = 50
-            message = f'MODERATE: {illiquid_percentage:.0f}% illiquid positions'
-        elif illiquid_percentage > 10:
-            score = 25
-            message = f'LOW: {illiquid_percentage:.0f}% illiquid positions'
-        else:
-            score = 0
-            message = f'GOOD: {illiquid_percentage:.0f}% illiquid positions'
+        tier = _creep_tier(illiquid_percentage, _LIQUIDITY_CREEP_THRESHOLDS)
+        score, label = _LIQUIDITY_CREEP_TIERS[tier]
+        message = f'{label}: {illiquid_percentage:.0f}% illiquid positions'
         
         return {
             'detected': score > 50,
@@ -6710,26 +6866,21 @@ def _analyze_liquidity_creep(positions):
     except Exception as e:
         return {'detected': False, 'score': 0, 'message': f'Error analyzing liquidity: {e}'}
 
+# Weights for DTE, delta, size and liquidity creep (DTE and Delta are more important)
+_CREEP_WEIGHTS = np.array([0.35, 0.35, 0.15, 0.15])
+
 def _calculate_overall_risk_score(dte_creep, delta_creep, size_creep, liquidity_creep):
     """Calculate overall risk score from all creep factors"""
     try:
-        scores = [
+        scores = np.array([
             dte_creep.get('score', 0),
             delta_creep.get('score', 0),
             size_creep.get('score', 0),
             liquidity_creep.get('score', 0)
-        ]
+        ], dtype=float)
         
-        # Weight the scores (DTE and Delta are more important)
-        weighted_scores = [
-            scores[0] * 0.35,  # DTE creep
-            scores[1] * 0.35,  # Delta creep
-            scores[2] * 0.15,  # Size creep
-            scores[3] * 0.15   # Liquidity creep
-        ]
-        
-        total_score = sum(weighted_scores)
-        return min(total_score, 100)  # Cap at 100%
+        total_score = float(np.dot(scores, _CREEP_WEIGHTS))
+        return min(total_score, 100.0)  # Cap at 100%
     except Exception as e:
         return 0
 
@@ -6797,28 +6948,34 @@ def get_positions_for_delta_service():
         logger.error(f"❌ Error getting positions for delta service: {e}")
         return jsonify([])
 
+# Sector limit payload reused while positions are unchanged, for up to SECTOR_LIMIT_TTL seconds
+SECTOR_LIMIT_TTL = 10.0
+_sector_limit_cache = {'ts': 0.0, 'key': None, 'data': None}
+
 @app.route('/api/sector-limit-enforcement')
 def get_sector_limit_enforcement():
     """Get sector limit enforcement data"""
     try:
         logger.info("Fetching sector limit enforcement data...")
         
-        # Get current date
-        current_date = datetime.now()
-        
         # Get sector limit data from monitor
         try:
             if dashboard and dashboard.monitor:
                 # Get positions for sector analysis
                 positions = dashboard.get_positions() if hasattr(dashboard, 'get_positions') else []
                 
-                # Calculate sector allocation
-                sector_allocation = _calculate_sector_allocation(positions)
-                sector_alerts = _check_sector_limits(sector_allocation)
-                rebalancing_recommendations = _generate_rebalancing_recommendations(sector_allocation)
+                sector_positions = _sector_position_array(positions)
+                
+                # Skip the analysis when the same positions were analyzed moments ago
+                cache_key = (dashboard.positions_version, sector_positions.dtype, sector_positions.tobytes())
+                cached = _sector_limit_cache
+                if (cached['data'] is not None and cached['key'] == cache_key
+                        and time.monotonic() - cached['ts'] < SECTOR_LIMIT_TTL):
+                    return ojsonify(cached['data'])
                 
-                # Overall sector risk assessment
-                total_sector_risk = _calculate_sector_risk_score(sector_allocation)
+                # Calculate sector allocation, limit alerts, recommendations and overall sector risk
+                sector_allocation = _calculate_sector_allocation(sector_positions)
+                sector_alerts, rebalancing_recommendations, total_sector_risk = _analyze_sector_allocation(sector_allocation)
                 
             else:
                 raise ValueError("No monitor available for sector limit analysis")
@@ -6853,155 +7010,131 @@ def get_sector_limit_enforcement():
             'sector_alerts': sector_alerts,
             'rebalancing_recommendations': rebalancing_recommendations,
             'max_sector_limit': 25.0,
-            'last_updated': current_date.strftime('%Y-%m-%d %H:%M:%S')
+            # Stamped once per computation; cache hits report when the analysis was produced
+            'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
         
+        _sector_limit_cache.update(ts=time.monotonic(), key=cache_key, data=sector_limit_data)
         logger.info(f"✅ Sector limit enforcement: {total_sector_risk:.0f}% ({risk_level})")
-        return jsonify(sector_limit_data)
+        return ojsonify(sector_limit_data)
         
     except Exception as e:
         logger.error(f"Error getting sector limit enforcement data: {e}")
         return jsonify({'error': str(e)}), 500
 
+# Define sector mappings (simplified)
+_SECTOR_MAPPINGS = {
+    'Technology': frozenset({'AAPL', 'MSFT', 'GOOG', 'AMZN', 'NVDA', 'META', 'TSLA', 'NFLX', 'ADBE', 'CRM'}),
+    'Financial': frozenset({'JPM', 'BAC', 'WFC', 'GS', 'MS', 'C', 'AXP', 'BLK', 'SCHW', 'USB'}),
+    'Healthcare': frozenset({'JNJ', 'PFE', 'UNH', 'ABBV', 'MRK', 'TMO', 'ABT', 'DHR', 'BMY', 'AMGN'}),
+    'Consumer': frozenset({'PG', 'KO', 'PEP', 'WMT', 'HD', 'MCD', 'DIS', 'NKE', 'SBUX', 'TGT'}),
+    'Energy': frozenset({'XOM', 'CVX', 'COP', 'EOG', 'SLB', 'PSX', 'VLO', 'MPC', 'HAL', 'BKR'}),
+    'Industrial': frozenset({'CAT', 'BA', 'MMM', 'GE', 'HON', 'UPS', 'RTX', 'LMT', 'DE', 'EMR'}),
+    'Materials': frozenset({'LIN', 'APD', 'FCX', 'NEM', 'DOW', 'DD', 'NUE', 'BLL', 'ALB', 'ECL'}),
+    'Utilities': frozenset({'NEE', 'DUK', 'SO', 'D', 'AEP', 'XEL', 'SRE', 'DTE', 'WEC', 'ED'})
+}
+
+# Inverted symbol -> sector lookup, built once at import
+_SYMBOL_SECTOR = {symbol: sector for sector, symbols in _SECTOR_MAPPINGS.items() for symbol in symbols}
+
+# Sector names by index ('Other' last) and the matching symbol -> sector index lookup
+_SECTOR_NAMES = tuple(_SECTOR_MAPPINGS) + ('Other',)
+_OTHER_SECTOR_INDEX = len(_SECTOR_NAMES) - 1
+_SYMBOL_SECTOR_INDEX = {symbol: _SECTOR_NAMES.index(sector) for symbol, sector in _SYMBOL_SECTOR.items()}
+
+def sector_position_dtype(symbol_width):
+    """Column layout for sector analysis, one row per held position"""
+    return np.dtype([('symbol', f'U{symbol_width}'), ('market_value', 'f8')])
+
+def _sector_position_array(positions):
+    """Pack positions with a market value into a sector_position_dtype structured array"""
+    held = []
+    for pos in positions:
+        market_value = pos.get('market_value')
+        if market_value:
+            held.append((pos.get('symbol', '').upper(), market_value))
+    # Size the symbol field from the data - NumPy silently truncates strings wider than the field
+    symbol_width = max((len(symbol) for symbol, _ in held), default=1)
+    return np.array(held, dtype=sector_position_dtype(symbol_width))
+
 def _calculate_sector_allocation(positions):
-    """Calculate current sector allocation from positions"""
-    try:
-        # Define sector mappings (simplified)
-        sector_mappings = {
-            'Technology': ['AAPL', 'MSFT', 'GOOG', 'AMZN', 'NVDA', 'META', 'TSLA', 'NFLX', 'ADBE', 'CRM'],
-            'Financial': ['JPM', 'BAC', 'WFC', 'GS', 'MS', 'C', 'AXP', 'BLK', 'SCHW', 'USB'],
-            'Healthcare': ['JNJ', 'PFE', 'UNH', 'ABBV', 'MRK', 'TMO', 'ABT', 'DHR', 'BMY', 'AMGN'],
-            'Consumer': ['PG', 'KO', 'PEP', 'WMT', 'HD', 'MCD', 'DIS', 'NKE', 'SBUX', 'TGT'],
-            'Energy': ['XOM', 'CVX', 'COP', 'EOG', 'SLB', 'PSX', 'VLO', 'MPC', 'HAL', 'BKR'],
-            'Industrial': ['CAT', 'BA', 'MMM', 'GE', 'HON', 'UPS', 'RTX', 'LMT', 'DE', 'EMR'],
-            'Materials': ['LIN', 'APD', 'FCX', 'NEM', 'DOW', 'DD', 'NUE', 'BLL', 'ALB', 'ECL'],
-            'Utilities': ['NEE', 'DUK', 'SO', 'D', 'AEP', 'XEL', 'SRE', 'DTE', 'WEC', 'ED']
-        }
-        
-        # Calculate total portfolio value
-        total_value = 0
-        sector_values = {}
-        
-        for pos in positions:
-            if pos.get('market_value'):
-                market_value = abs(pos.get('market_value', 0))
-                total_value += market_value
-                
-                # Determine sector for this position
-                symbol = pos.get('symbol', '').upper()
-                sector = 'Other'
-                
-                for sector_name, symbols in sector_mappings.items():
-                    if symbol in symbols:
-                        sector = sector_name
-                        break
-                
-                # Add to sector total
-                if sector not in sector_values:
-                    sector_values[sector] = 0
-                sector_values[sector] += market_value
-        
-        # Calculate percentages
-        sector_allocation = {}
-        for sector, value in sector_values.items():
-            percentage = (value / total_value * 100) if total_value > 0 else 0
-            sector_allocation[sector] = {
-                'value': value,
-                'percentage': percentage,
-                'status': 'over_limit' if percentage > 25 else 'normal',
-                'color': 'red' if percentage > 25 else 'green'
-            }
-        
-        return sector_allocation
-        
-    except Exception as e:
+    """Calculate current sector allocation from a sector_position_dtype array (or a list of position dicts)"""
+    if not isinstance(positions, np.ndarray):
+        positions = _sector_position_array(positions)
+    if not len(positions):
         return {}
+    
+    # Classify each position and total its market value per sector
+    sector_index = (pd.Series(positions['symbol']).map(_SYMBOL_SECTOR_INDEX)
+                    .fillna(_OTHER_SECTOR_INDEX).to_numpy(dtype=np.intp))
+    market_values = np.abs(positions['market_value'])
+    sector_values = np.bincount(sector_index, weights=market_values, minlength=len(_SECTOR_NAMES))
+    
+    # Calculate percentages
+    total_value = market_values.sum()
+    percentages = sector_values / total_value * 100 if total_value > 0 else np.zeros_like(sector_values)
+    
+    # Report sectors in order of first appearance
+    present, first_seen = np.unique(sector_index, return_index=True)
+    sector_allocation = {}
+    for i in present[np.argsort(first_seen)].tolist():
+        percentage = float(percentages[i])
+        sector_allocation[_SECTOR_NAMES[i]] = {
+            'value': float(sector_values[i]),
+            'percentage': percentage,
+            'status': 'over_limit' if percentage > 25 else 'normal',
+            'color': 'red' if percentage > 25 else 'green'
+        }
+    
+    return sector_allocation
+
+# Sector concentration risk: a percentage strictly above _SECTOR_RISK_BINS[i] scores _SECTOR_RISK_SCORES[i + 1]
+_SECTOR_RISK_BINS = np.array([10.0, 20.0, 25.0, 30.0, 40.0])
+_SECTOR_RISK_SCORES = np.array([0.0, 10.0, 25.0, 50.0, 75.0, 100.0])  # Normal, very low, low, moderate, high, critical
 
-def _check_sector_limits(sector_allocation):
-    """Check for sectors exceeding the 25% limit"""
+# Status codes returned by _njit_sector_scores
+SECTOR_STATUS_NORMAL, SECTOR_STATUS_UNDER, SECTOR_STATUS_OVER, SECTOR_STATUS_OVER_HIGH = range(4)
+
+def _analyze_sector_allocation(sector_allocation):
+    """Check sector limits, build rebalancing recommendations and score sector risk in one pass"""
     alerts = []
-    
-    for sector, data in sector_allocation.items():
-        if data['percentage'] > 25:
+    recommendations = []
+    if not sector_allocation:
+        return alerts, recommendations, 0
+    
+    # Risk scoring based on concentration (averaged across sectors) and per-sector limit status
+    percentages = np.fromiter((data['percentage'] for data in sector_allocation.values()),
+                              dtype=np.float64, count=len(sector_allocation))
+    risk_score, statuses = _njit_sector_scores(percentages, _SECTOR_RISK_BINS, _SECTOR_RISK_SCORES)
+    
+    reduce_count = 0  # Reductions are kept ahead of increases
+    for sector, percentage, status in zip(sector_allocation, percentages.tolist(), statuses.tolist()):
+        # Sectors exceeding the 25% limit
+        if status >= SECTOR_STATUS_OVER:
+            excess = percentage - 25
             alerts.append({
                 'sector': sector,
-                'percentage': data['percentage'],
-                'severity': 'high' if data['percentage'] > 30 else 'moderate',
-                'message': f'{sector}: {data["percentage"]:.1f}% (Limit: 25%)',
-                'action': f'Reduce {sector} exposure by {data["percentage"] - 25:.1f}%'
+                'percentage': percentage,
+                'severity': 'high' if status == SECTOR_STATUS_OVER_HIGH else 'moderate',
+                'message': f'{sector}: {percentage:.1f}% (Limit: 25%)',
+                'action': f'Reduce {sector} exposure by {excess:.1f}%'
             })
-    
-    return alerts
-
-def _generate_rebalancing_recommendations(sector_allocation):
-    """Generate specific rebalancing recommendations"""
-    recommendations = []
-    
-    # Find over-allocated sectors
-    over_allocated = []
-    under_allocated = []
-    
-    for sector, data in sector_allocation.items():
-        if data['percentage'] > 25:
-            over_allocated.append({
+            recommendations.insert(reduce_count, {
+                'type': 'reduce',
                 'sector': sector,
-                'excess': data['percentage'] - 25,
-                'current': data['percentage']
+                'action': f"Reduce {sector} by {excess:.1f}%",
+                'priority': 'high' if excess > 10 else 'moderate'
             })
-        elif data['percentage'] < 5:  # Under-allocated sectors
-            under_allocated.append({
+            reduce_count += 1
+        elif status == SECTOR_STATUS_UNDER:  # Under-allocated sectors
+            recommendations.append({
+                'type': 'increase',
                 'sector': sector,
-                'current': data['percentage']
+                'action': f"Consider increasing {sector} exposure",
+                'priority': 'low'
             })
     
-    # Generate recommendations
-    for over_sector in over_allocated:
-        recommendations.append({
-            'type': 'reduce',
-            'sector': over_sector['sector'],
-            'action': f"Reduce {over_sector['sector']} by {over_sector['excess']:.1f}%",
-            'priority': 'high' if over_sector['excess'] > 10 else 'moderate'
-        })
-    
-    for under_sector in under_allocated:
-        recommendations.append({
-            'type': 'increase',
-            'sector': under_sector['sector'],
-            'action': f"Consider increasing {under_sector['sector']} exposure",
-            'priority': 'low'
-        })
-    
-    return recommendations
-
-def _calculate_sector_risk_score(sector_allocation):
-    """Calculate overall sector risk score"""
-    try:
-        risk_score = 0
-        
-        for sector, data in sector_allocation.items():
-            percentage = data['percentage']
-            
-            # Risk scoring based on concentration
-            if percentage > 40:
-                risk_score += 100  # Critical
-            elif percentage > 30:
-                risk_score += 75   # High
-            elif percentage > 25:
-                risk_score += 50   # Moderate
-            elif percentage > 20:
-                risk_score += 25   # Low
-            elif percentage > 10:
-                risk_score += 10   # Very low
-            else:
-                risk_score += 0    # Normal
-        
-        # Average the risk scores
-        if sector_allocation:
-            risk_score = risk_score / len(sector_allocation)
-        
-        return min(risk_score, 100)  # Cap at 100%
-    except Exception as e:
-        return 0
+    return alerts, recommendations, min(float(risk_score), 100)  # Cap at 100%
 
 # -------------------------------------------------------------
 # Configuration
@@ -7243,21 +7376,7 @@ def main():
     try:
         logger.info("Starting web server and monitoring...")
         
-        # Start monitoring in a separate thread with its own event loop
-        def start_monitoring():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            while True:
-                try:
-                    loop.run_until_complete(dashboard.update_dashboard_async())
-                    time.sleep(30)
-                except Exception as e:
-                    logger.error(f"Monitor loop error: {e}")
-                    time.sleep(5)  # Short delay on error
-            
-        monitor_thread = threading.Thread(target=start_monitoring, daemon=True)
-        monitor_thread.start()
-        
+        # Monitoring already runs on the dashboard's loop (see start_monitoring)
         # Run Flask server in main thread
         socketio.run(app, host='0.0.0.0', port=7001, debug=False, allow_unsafe_werkzeug=True)
     except Exception as e:
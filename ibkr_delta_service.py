@@ -5,10 +5,16 @@ Solves event loop conflicts by running IBKR calls in separate process
 """
 
 import asyncio
-import json
+import contextlib
+import functools
+import orjson
+import os
+import random
+import tempfile
 import time
 import logging
 import aiohttp
+import socketio
 from datetime import datetime
 from ib_insync import *
 
@@ -16,6 +22,36 @@ from ib_insync import *
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# IB allows 100 concurrent market data lines by default and silently drops requests past that; stay below it
+MAX_MKT_DATA_LINES = 90
+
+# Retry delay after a failed cycle doubles per consecutive failure up to this many seconds
+MAX_RETRY_DELAY = 300
+
+# Unchanged deltas are rewritten this often (seconds) so readers, which treat a cache older than 5 minutes as stale, keep trusting it
+CACHE_REWRITE_INTERVAL = 120
+
+@functools.lru_cache(maxsize=256)
+def _parse_expiry(expiry):
+    """Parse an MM/DD/YYYY or YYYYMMDD expiry into a date; None if unparseable"""
+    try:
+        return datetime.strptime(expiry, '%m/%d/%Y' if '/' in expiry else '%Y%m%d').date()
+    except (TypeError, ValueError):
+        return None
+
+@functools.lru_cache(maxsize=256)
+def _normalize_expiry(expiry):
+    """Convert an MM/DD/YYYY expiry to IBKR's YYYYMMDD, passing other formats through; None if unparseable"""
+    if '/' not in expiry:
+        return expiry
+    expiry_date = _parse_expiry(expiry)
+    return expiry_date.strftime('%Y%m%d') if expiry_date else None
+
+def _delta_cache_key(symbol, strike, expiry, right):
+    """Key of one option contract in delta_cache.json, e.g. 'NVDA 20250815 175 C' (expiry as YYYYMMDD)"""
+    # Must match the dashboard's _delta_cache_key in complete-wheel-strategy-system.py
+    return f"{symbol} {expiry} {float(strike):g} {right}"
+
 class IBKRDeltaService:
     def __init__(self, host='127.0.0.1', port=7496, client_id=9999):
         self.host = host
@@ -23,6 +59,15 @@ class IBKRDeltaService:
         self.client_id = client_id
         self.ib = IB()
         self.cache_file = 'delta_cache.json'
+        self.pid_file = 'delta_service.pid'  # Present while connected; the launcher waits for it before starting Flask
+        self._mem_cache = (None, {})  # (mtime_ns, deltas) mirror of cache_file
+        self._last_write = 0.0  # time.monotonic() of the last cache_file write
+        self._contracts = {}  # (symbol, strike, expiry, right) -> qualified Option contract
+        self._greek_events = {}  # conId -> asyncio.Event set once that contract's ticker carries a delta
+        self._mkt_data_sem = asyncio.Semaphore(MAX_MKT_DATA_LINES)
+        self.ib.pendingTickersEvent += self._on_pending_tickers
+        self._session = None  # Long-lived aiohttp session for dashboard requests
+        self._refresh_event = asyncio.Event()  # Set when the dashboard pushes a changed set of positions
         self.running = False
         
     async def connect(self):
@@ -35,132 +80,141 @@ class IBKRDeltaService:
             logger.error(f"❌ Failed to connect to IBKR: {e}")
             return False
     
+    def _portfolio_options(self):
+        """Held option portfolio items keyed by (symbol, strike, expiry, right)"""
+        return {(item.contract.symbol, item.contract.strike, item.contract.lastTradeDateOrContractMonth, item.contract.right): item
+                for item in self.ib.portfolio() if item.contract.secType == 'OPT'}
+    
+    async def _qualify_contracts(self, options, held=None):
+        """Qualified contracts for (symbol, strike, expiry, right) tuples, None where IBKR cannot resolve one"""
+        # Resolve everything not cached yet; positions rarely change, so later cycles hit the cache
+        missing = [option for option in dict.fromkeys(options) if option not in self._contracts]
+        if missing:
+            # Held options come fully qualified from the portfolio, trading class and multiplier included
+            held = self._portfolio_options() if held is None else held
+            unheld = []
+            for option in missing:
+                item = held.get(option)
+                if item is not None:
+                    self._contracts[option] = item.contract
+                else:
+                    unheld.append(option)
+            
+            # Anything else is qualified from its fields in a single round trip
+            contracts = [Option(symbol, expiry, strike, right, 'SMART') for symbol, strike, expiry, right in unheld]
+            if contracts:
+                await self.ib.qualifyContractsAsync(*contracts)
+            for (symbol, strike, expiry, right), contract in zip(unheld, contracts):
+                if contract.conId:
+                    self._contracts[(symbol, strike, expiry, right)] = contract
+                else:
+                    logger.warning("⚠️ Could not qualify contract for %s %s %s %s", symbol, strike, expiry, right)
+        
+        return [self._contracts.get(option) for option in options]
+    
+    def _on_pending_tickers(self, tickers):
+        """Wake the Greeks waiters whose tickers now carry a delta"""
+        for ticker in tickers:
+            greeks_ready = self._greek_events.get(ticker.contract.conId)
+            if greeks_ready is not None and self._ticker_delta(ticker) is not None:
+                greeks_ready.set()
+    
+    async def _wait_for_greeks(self, ticker, max_wait=15.0):
+        """Wait for a subscribed ticker to carry a delta - woken by ticker updates instead of polling"""
+        con_id = ticker.contract.conId
+        greeks_ready = self._greek_events.setdefault(con_id, asyncio.Event())
+        try:
+            if self._ticker_delta(ticker) is None:  # Greeks may already be on the ticker
+                await asyncio.wait_for(greeks_ready.wait(), timeout=max_wait)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._greek_events.pop(con_id, None)
+        
+        return self._ticker_delta(ticker)
+    
+    async def _fetch_greeks(self, contract):
+        """Subscribe to a contract's Greeks, wait for its delta and release the market data line"""
+        async with self._mkt_data_sem:
+            ticker = self.ib.reqMktData(contract, '106', False, False)
+            try:
+                return await self._wait_for_greeks(ticker)
+            finally:
+                self.ib.cancelMktData(contract)
+    
     async def get_live_delta(self, symbol, strike, expiry, right):
         """Get live delta from IBKR for a specific option"""
         try:
-            # Find the actual position in IBKR portfolio
-            portfolio_items = self.ib.portfolio()
-            matching_item = None
-            
-            for item in portfolio_items:
-                if (hasattr(item.contract, 'symbol') and item.contract.symbol == symbol and
-                    hasattr(item.contract, 'strike') and item.contract.strike == strike and
-                    hasattr(item.contract, 'right') and item.contract.right == right):
-                    matching_item = item
-                    break
+            # Check if we can get Greeks directly from portfolio item
+            held = self._portfolio_options()
+            delta_value = self._portfolio_delta(held.get((symbol, strike, expiry, right)))
+            if delta_value is not None:
+                logger.info("✅ %s %s %s: LIVE delta from portfolio %.3f", symbol, strike, right, delta_value)
+                return delta_value
             
-            if not matching_item:
-                logger.warning(f"⚠️ Could not find position for {symbol} {strike} {right}")
+            contract, = await self._qualify_contracts([(symbol, strike, expiry, right)], held)
+            if contract is None:
                 return None
             
-            contract = matching_item.contract
-            logger.info(f"🔍 Found position: {contract}")
-            
-            # Check if we can get Greeks directly from portfolio item
-            if hasattr(matching_item, 'modelGreeks') and matching_item.modelGreeks:
-                if hasattr(matching_item.modelGreeks, 'delta') and matching_item.modelGreeks.delta is not None:
-                    delta_value = float(matching_item.modelGreeks.delta)
-                    logger.info(f"✅ {symbol} {strike} {right}: LIVE delta from portfolio {delta_value:.3f}")
-                    return delta_value
-            
             # Request market data with Greeks
-            logger.info(f"🔍 Requesting live Greeks for {symbol} {strike} {right}...")
+            logger.info("🔍 Requesting live Greeks for %s %s %s...", symbol, strike, right)
             
             # Method 1: Request with generic tick types for Greeks
-            ticker = self.ib.reqMktData(contract, '106', False, False)
-            
-            # Wait for Greeks to populate
-            max_wait = 15.0
-            wait_interval = 0.5
-            elapsed = 0
+            delta_value = await self._fetch_greeks(contract)
             
-            while elapsed < max_wait:
-                await asyncio.sleep(wait_interval)
-                elapsed += wait_interval
-                
-                # Check if Greeks are available in modelGreeks
-                if hasattr(ticker, 'modelGreeks') and ticker.modelGreeks:
-                    if hasattr(ticker.modelGreeks, 'delta') and ticker.modelGreeks.delta is not None:
-                        delta_value = float(ticker.modelGreeks.delta)
-                        self.ib.cancelMktData(contract)
-                        logger.info(f"✅ {symbol} {strike} {right}: LIVE delta {delta_value:.3f}")
-                        return delta_value
-                
-                # Check for generic tick data (tick type 23 = Delta)
-                if hasattr(ticker, 'genericTicks') and ticker.genericTicks:
-                    for tick in ticker.genericTicks:
-                        if tick.tickType == 23:  # Delta
-                            delta_value = float(tick.value)
-                            self.ib.cancelMktData(contract)
-                            logger.info(f"✅ {symbol} {strike} {right}: LIVE delta {delta_value:.3f}")
-                            return delta_value
-                
-                # Check for option computation tick data
-                if hasattr(ticker, 'optionComputation') and ticker.optionComputation:
-                    for comp in ticker.optionComputation:
-                        if hasattr(comp, 'delta') and comp.delta is not None:
-                            delta_value = float(comp.delta)
-                            self.ib.cancelMktData(contract)
-                            logger.info(f"✅ {symbol} {strike} {right}: LIVE delta {delta_value:.3f}")
-                            return delta_value
-            
-            # Timeout - try alternative method with different tick types
-            self.ib.cancelMktData(contract)
-            logger.warning(f"⚠️ Timeout getting Greeks for {symbol} {strike} {right}, trying alternative method...")
-            
-            # Method 2: Try with different tick types
-            try:
-                ticker2 = self.ib.reqMktData(contract, '23', False, False)
-                await asyncio.sleep(3)
-                
-                if hasattr(ticker2, 'genericTicks') and ticker2.genericTicks:
-                    for tick in ticker2.genericTicks:
-                        if tick.tickType == 23:  # Delta
-                            delta_value = float(tick.value)
-                            self.ib.cancelMktData(contract)
-                            logger.info(f"✅ {symbol} {strike} {right}: LIVE delta (alt method) {delta_value:.3f}")
-                            return delta_value
-                
-                self.ib.cancelMktData(contract)
-            except Exception as e:
-                logger.warning(f"⚠️ Alternative method failed: {e}")
-            
-            # Method 3: Try with specific Greeks tick types
-            try:
-                ticker3 = self.ib.reqMktData(contract, '24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50', False, False)
-                await asyncio.sleep(3)
-                
-                if hasattr(ticker3, 'genericTicks') and ticker3.genericTicks:
-                    for tick in ticker3.genericTicks:
-                        if tick.tickType == 23:  # Delta
-                            delta_value = float(tick.value)
-                            self.ib.cancelMktData(contract)
-                            logger.info(f"✅ {symbol} {strike} {right}: LIVE delta (method 3) {delta_value:.3f}")
-                            return delta_value
-                
-                self.ib.cancelMktData(contract)
-            except Exception as e:
-                logger.warning(f"⚠️ Method 3 failed: {e}")
+            if delta_value is None:
+                logger.warning("⚠️ Timeout getting Greeks for %s %s %s", symbol, strike, right)
+                return None
             
-            logger.warning(f"⚠️ Could not get live delta for {symbol} {strike} {right}")
-            return None
+            logger.info("✅ %s %s %s: LIVE delta %.3f", symbol, strike, right, delta_value)
+            return delta_value
             
         except Exception as e:
-            logger.error(f"❌ Error getting delta for {symbol} {strike} {right}: {e}")
+            logger.error("❌ Error getting delta for %s %s %s: %s", symbol, strike, right, e)
             return None
     
+    @staticmethod
+    def _portfolio_delta(item):
+        """Return the delta TWS already pushed with a portfolio item, or None"""
+        greeks = getattr(item, 'modelGreeks', None)
+        if greeks is not None and greeks.delta is not None:
+            return float(greeks.delta)
+        return None
+    
+    @staticmethod
+    def _ticker_delta(ticker):
+        """Return the delta carried by a market data ticker, or None if it has not arrived yet"""
+        # Check if Greeks are available in modelGreeks
+        greeks = ticker.modelGreeks
+        if greeks is not None and greeks.delta is not None:
+            return float(greeks.delta)
+        
+        # Check for generic tick data (tick type 23 = Delta)
+        for tick in getattr(ticker, 'genericTicks', None) or ():
+            if tick.tickType == 23:  # Delta
+                return float(tick.value)
+        
+        # Check for option computation tick data
+        for comp in getattr(ticker, 'optionComputation', None) or ():
+            delta = getattr(comp, 'delta', None)
+            if delta is not None:
+                return float(delta)
+        
+        return None
+    
     async def update_delta_cache(self, positions):
         """Update delta cache for all positions"""
         try:
+            now = datetime.now()  # One clock read per cycle, used for the cache timestamp
             delta_cache = {}
+            options = []
             
             for position in positions:
                 symbol = position.get('symbol')
                 contract_type = position.get('contract_type', 'STK')
                 
                 if contract_type == 'STK':
-                    # Stock delta is always 1.0
-                    delta_cache[symbol] = 1.0
+                    # Stock delta is always 1.0 - nothing to cache, and one entry per symbol would shadow its options
                     continue
                 
                 # For options, get live delta
@@ -169,136 +223,86 @@ class IBKRDeltaService:
                 right = position.get('option_type', '')
                 
                 if not all([symbol, strike, expiry, right]):
-                    logger.warning(f"⚠️ Missing data for {symbol}: strike={strike}, expiry={expiry}, right={right}")
+                    logger.warning("⚠️ Missing data for %s: strike=%s, expiry=%s, right=%s", symbol, strike, expiry, right)
                     continue
                 
-                # Convert expiry format if needed
-                if '/' in expiry:
-                    # Convert MM/DD/YYYY to YYYYMMDD
-                    try:
-                        date_obj = datetime.strptime(expiry, '%m/%d/%Y')
-                        expiry = date_obj.strftime('%Y%m%d')
-                    except:
-                        logger.warning(f"⚠️ Could not parse expiry {expiry} for {symbol}")
-                        continue
-                
-                # Get live delta - ONLY use live deltas, no fallback
-                live_delta = await self.get_live_delta(symbol, strike, expiry, right)
-                if live_delta is not None:
-                    delta_cache[symbol] = live_delta
-                    logger.info(f"✅ {symbol}: Using LIVE delta {live_delta:.3f}")
-                else:
-                    logger.error(f"❌ Could not get live delta for {symbol} - SKIPPING")
+                # Convert expiry format if needed - the same handful of expiries repeat every cycle
+                normalized_expiry = _normalize_expiry(expiry)
+                if normalized_expiry is None:
+                    logger.warning("⚠️ Could not parse expiry %s for %s", expiry, symbol)
                     continue
+                expiry = normalized_expiry
+                
+                options.append((symbol, strike, expiry, right))
             
-            # Save to cache file
-            with open(self.cache_file, 'w') as f:
-                json.dump({
-                    'timestamp': datetime.now().isoformat(),
-                    'deltas': delta_cache
-                }, f, indent=2)
-            
-            logger.info(f"✅ Updated delta cache with {len(delta_cache)} positions")
-            return delta_cache
+            # Greeks TWS already pushed with the portfolio need no market data line
+            held = self._portfolio_options()
+            live_deltas = [self._portfolio_delta(held.get(option)) for option in options]
             
-        except Exception as e:
-            logger.error(f"❌ Error updating delta cache: {e}")
-            return {}
-    
-    def _calculate_smart_delta(self, symbol, strike, expiry, right):
-        """Calculate smart delta estimate based on moneyness and time to expiry"""
-        try:
-            # Use actual stock prices from IBKR data
-            stock_prices = {
-                'DE': 514.5,
-                'GOOG': 189.0, 
-                'JPM': 283.5,
-                'NVDA': 183.3,
-                'UNH': 270.0,
-                'WMT': 94.0,
-                'XOM': 110.0
-            }
+            # Qualify the rest
+            missing = [i for i, live_delta in enumerate(live_deltas) if live_delta is None]
+            contracts = await self._qualify_contracts([options[i] for i in missing], held)
+            pending = [(i, contract) for i, contract in zip(missing, contracts) if contract is not None]
             
-            # Get current stock price
-            stock_price = stock_prices.get(symbol, strike)  # Use actual price or fallback to strike
+            # Method 1 for all remaining options in one burst, so the Greeks waits overlap
+            logger.info("🔍 Requesting live Greeks for %d options...", len(pending))
+            greeks = await asyncio.gather(*(self._fetch_greeks(contract) for _, contract in pending))
             
-            # Calculate moneyness
-            moneyness = stock_price / strike
+            for (i, contract), delta_value in zip(pending, greeks):
+                if delta_value is None:
+                    symbol, strike, _, right = options[i]
+                    logger.warning("⚠️ Timeout getting Greeks for %s %s %s", symbol, strike, right)
+                live_deltas[i] = delta_value
             
-            # Get days to expiry
-            dte = 30  # Default
-            try:
-                if '/' in expiry:
-                    expiry_date = datetime.strptime(expiry, '%m/%d/%Y')
-                else:
-                    expiry_date = datetime.strptime(expiry, '%Y%m%d')
-                dte = (expiry_date - datetime.now()).days
-                dte = max(dte, 1)  # Ensure positive
-            except:
-                dte = 30
-            
-            # Smart delta estimation based on moneyness and DTE
-            if right == 'C':  # Call option
-                if moneyness > 1.05:  # ITM
-                    delta = 0.8 + (moneyness - 1.05) * 0.4
-                elif moneyness > 0.95:  # Near ATM
-                    delta = 0.4 + (moneyness - 0.95) * 0.4
-                elif moneyness > 0.85:  # OTM
-                    delta = 0.2 + (moneyness - 0.85) * 0.2
-                else:  # Deep OTM
-                    delta = 0.1
-                
-                # Adjust for DTE - longer DTE means higher delta for ITM, lower for OTM
-                if dte < 7:
-                    delta *= 0.8  # Short-term options have lower deltas
-                elif dte > 45:
-                    delta *= 1.1  # Long-term options have higher deltas
-                    
-            else:  # Put option
-                if moneyness < 0.95:  # ITM
-                    delta = -0.8 - (0.95 - moneyness) * 0.4
-                elif moneyness < 1.05:  # Near ATM
-                    delta = -0.4 - (1.05 - moneyness) * 0.4
-                elif moneyness < 1.15:  # OTM
-                    delta = -0.2 - (1.15 - moneyness) * 0.2
-                else:  # Deep OTM
-                    delta = -0.1
-                
-                # Adjust for DTE - longer DTE means lower delta (more negative) for ITM
-                if dte < 7:
-                    delta *= 0.8  # Short-term options have higher deltas (less negative)
-                elif dte > 45:
-                    delta *= 1.1  # Long-term options have lower deltas (more negative)
+            # ONLY use live deltas, no fallback
+            for (symbol, strike, expiry, right), live_delta in zip(options, live_deltas):
+                if live_delta is None:
+                    logger.error("❌ Could not get live delta for %s - SKIPPING", symbol)
+                    continue
+                delta_cache[_delta_cache_key(symbol, strike, expiry, right)] = live_delta
+                logger.info("✅ %s: Using LIVE delta %.3f", symbol, live_delta)
             
-            # Add some randomness for realism
-            import random
-            # Use stock price and strike to create unique seed
-            unique_seed = int((stock_price * 1000 + strike * 100 + hash(symbol) % 1000))
-            random.seed(unique_seed)
-            delta += random.uniform(-0.03, 0.03)
+            # Skip the write when the file already holds these deltas and its timestamp is still recent
+            if delta_cache == self._mem_cache[1] and time.monotonic() - self._last_write < CACHE_REWRITE_INTERVAL:
+                logger.info("✅ Delta cache unchanged (%d positions)", len(delta_cache))
+                return delta_cache
             
-            # Ensure delta is within reasonable bounds
-            if right == 'C':
-                delta = max(0.0, min(1.0, delta))
-            else:
-                delta = max(-1.0, min(0.0, delta))
+            # Save to cache file - write a temp file and swap it in so readers never see a partial file
+            fd, tmp_file = tempfile.mkstemp(dir=os.path.dirname(self.cache_file) or '.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(orjson.dumps({
+                        'timestamp': now.isoformat(),
+                        'deltas': delta_cache
+                    }))
+                os.replace(tmp_file, self.cache_file)
+            except BaseException:
+                os.unlink(tmp_file)
+                raise
+            self._mem_cache = (os.stat(self.cache_file).st_mtime_ns, delta_cache)
+            self._last_write = time.monotonic()
             
-            logger.info(f"🧮 {symbol} {strike} {right}: Smart delta estimate {delta:.3f} (DTE={dte}, moneyness={moneyness:.2f})")
-            return delta
+            logger.info("✅ Updated delta cache with %d positions", len(delta_cache))
+            return delta_cache
             
         except Exception as e:
-            logger.error(f"❌ Error in smart delta calculation for {symbol}: {e}")
-            # Ultimate fallback to conservative values
-            return -0.3 if right == 'P' else 0.3
+            logger.error("❌ Error updating delta cache: %s", e)
+            return {}
     
     def get_cached_deltas(self):
         """Get cached delta values"""
         try:
-            with open(self.cache_file, 'r') as f:
-                data = json.load(f)
-                return data.get('deltas', {})
+            mtime_ns = os.stat(self.cache_file).st_mtime_ns
+            if mtime_ns == self._mem_cache[0]:
+                return self._mem_cache[1]
+            with open(self.cache_file, 'rb') as f:
+                data = orjson.loads(f.read())
+            deltas = data.get('deltas', {})
+            self._mem_cache = (mtime_ns, deltas)
+            return deltas
         except FileNotFoundError:
             logger.info("📄 No delta cache file found")
+            self._mem_cache = (None, {})  # Forget the mirror so the next update rewrites the file
             return {}
         except Exception as e:
             logger.error(f"❌ Error reading delta cache: {e}")
@@ -307,19 +311,47 @@ class IBKRDeltaService:
     async def get_positions_from_dashboard(self):
         """Get positions from the dashboard API"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get('http://localhost:7001/api/positions-for-delta-service') as response:
-                    if response.status == 200:
-                        positions = await response.json()
-                        logger.info(f"📊 Retrieved {len(positions)} positions from dashboard")
-                        return positions
-                    else:
-                        logger.warning(f"⚠️ Failed to get positions from dashboard: {response.status}")
-                        return []
+            # Reuse one session so the dashboard connection is kept alive between cycles
+            if self._session is None or self._session.closed:
+                self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=60))
+            async with self._session.get('http://localhost:7001/api/positions-for-delta-service') as response:
+                if response.status == 200:
+                    positions = await response.json(loads=orjson.loads)
+                    logger.info(f"📊 Retrieved {len(positions)} positions from dashboard")
+                    return positions
+                else:
+                    logger.warning(f"⚠️ Failed to get positions from dashboard: {response.status}")
+                    return []
         except Exception as e:
             logger.error(f"❌ Error getting positions from dashboard: {e}")
             return []
 
+    async def _watch_dashboard(self, url='http://localhost:7001', retry_interval=30):
+        """Trigger a delta refresh whenever the dashboard's Socket.IO updates carry a changed set of positions"""
+        sio = socketio.AsyncClient()
+        last_signature = None
+        
+        @sio.on('update')
+        async def on_update(data):
+            nonlocal last_signature
+            signature = tuple((p.get('symbol'), p.get('contract_type'), p.get('strike'), p.get('expiry'), p.get('position'))
+                              for p in data.get('positions') or ())
+            if signature != last_signature:
+                last_signature = signature
+                self._refresh_event.set()
+        
+        try:
+            while self.running:
+                try:
+                    await sio.connect(url)
+                    await sio.wait()
+                except Exception as e:
+                    logger.warning(f"⚠️ Dashboard updates unavailable ({e}), relying on the update interval")
+                await asyncio.sleep(retry_interval)
+        finally:
+            # Close the websocket and the client's HTTP session when the service stops
+            await sio.disconnect()
+    
     async def run_service(self, update_interval=30):
         """Run the delta service continuously"""
         self.running = True
@@ -329,8 +361,18 @@ class IBKRDeltaService:
             logger.error("❌ Failed to connect to IBKR, exiting")
             return
         
+        with open(self.pid_file, 'w') as f:
+            f.write(str(os.getpid()))
+        
+        watcher = asyncio.create_task(self._watch_dashboard())
+        fail_count = 0
+        
         while self.running:
             try:
+                # Reconnect after a dropped IBKR connection; a failed reconnect backs off like any other error
+                if not self.ib.isConnected() and not await self.connect():
+                    raise ConnectionError("IBKR connection lost and reconnect failed")
+                
                 logger.info("🔄 Updating delta cache...")
                 
                 # Get positions from dashboard
@@ -339,21 +381,38 @@ class IBKRDeltaService:
                     await self.update_delta_cache(positions)
                 else:
                     logger.warning("⚠️ No positions received from dashboard, skipping update")
+                fail_count = 0
                 
-                # Wait before next update
-                logger.info(f"⏰ Waiting {update_interval} seconds before next update...")
-                await asyncio.sleep(update_interval)
+                # Wait for the dashboard to report changed positions, or update_interval at most
+                logger.info(f"⏰ Waiting up to {update_interval} seconds before next update...")
+                try:
+                    await asyncio.wait_for(self._refresh_event.wait(), timeout=update_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._refresh_event.clear()
                 
             except KeyboardInterrupt:
                 logger.info("🛑 Received interrupt, shutting down...")
                 break
             except Exception as e:
-                logger.error(f"❌ Error in delta service: {e}")
-                await asyncio.sleep(10)  # Wait before retry
+                # Exponential backoff with jitter so a sustained outage doesn't become a retry storm
+                retry_delay = min(MAX_RETRY_DELAY, 2 ** fail_count) + random.uniform(0, 1)
+                fail_count += 1
+                logger.error(f"❌ Error in delta service: {e} (retrying in {retry_delay:.0f}s)")
+                await asyncio.sleep(retry_delay)
         
         # Cleanup
+        watcher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await watcher
+        if self._session is not None:
+            await self._session.close()
         if self.ib.isConnected():
             await self.ib.disconnectAsync()
+        try:
+            os.remove(self.pid_file)
+        except FileNotFoundError:
+            pass
         logger.info("✅ Delta service stopped")
 
 async def main():
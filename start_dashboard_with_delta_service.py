@@ -4,21 +4,51 @@ Startup script for Wheel Strategy Dashboard with Background Delta Service
 Runs both the IBKR delta service and the main Flask application
 """
 
+import argparse
 import subprocess
+import selectors
 import time
 import signal
 import sys
 import os
 from pathlib import Path
 
+# Resolved once so the launcher works from any directory; services run with HERE as their working directory
+HERE = Path(__file__).resolve().parent
+FLASK = HERE / 'complete-wheel-strategy-system.py'
+DELTA = HERE / 'ibkr_delta_service.py'
+
+DASHBOARD_URL = 'http://localhost:7001'
+
+# Written by the delta service once it has connected to IBKR
+DELTA_PID_FILE = HERE / 'delta_service.pid'
+
+# Every service runs in its own session, so cleanup() can signal its whole process tree at once.
+# Services inherit the launcher's stdout/stderr: nothing here would drain a stdout=PIPE, and once ~64 KiB of logs
+# fill the kernel pipe buffer the child blocks in write() and freezes mid-request.
+# Beyond stdio no launcher fd is inherited; anything a service should get (e.g. a log file) goes into pass_fds.
+CHILD_OPTIONS = {'start_new_session': True, 'close_fds': True, 'pass_fds': (), 'cwd': str(HERE)}
+
+if sys.platform.startswith('linux'):
+    import ctypes
+    
+    PR_SET_PDEATHSIG = 1
+    _libc = ctypes.CDLL("libc.so.6", use_errno=True)
+    
+    def _set_parent_death_signal():
+        """Have the kernel SIGTERM the child as soon as the launcher dies, even on SIGKILL"""
+        _libc.prctl(PR_SET_PDEATHSIG, signal.SIGTERM, 0, 0, 0)
+    
+    CHILD_OPTIONS['preexec_fn'] = _set_parent_death_signal
+
 def start_delta_service():
     """Start the background delta service"""
     print("🚀 Starting IBKR Delta Service...")
     
     # Start delta service in background
     delta_process = subprocess.Popen([
-        sys.executable, 'ibkr_delta_service.py'
-    ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        sys.executable, str(DELTA)
+    ], **CHILD_OPTIONS)
     
     print(f"✅ Delta service started with PID: {delta_process.pid}")
     return delta_process
@@ -29,62 +59,171 @@ def start_flask_app():
     
     # Start Flask app in background
     flask_process = subprocess.Popen([
-        sys.executable, 'complete-wheel-strategy-system.py'
-    ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        sys.executable, str(FLASK)
+    ], **CHILD_OPTIONS)
     
     print(f"✅ Flask app started with PID: {flask_process.pid}")
     return flask_process
 
+def wait_ready(process, timeout=30.0):
+    """Wait for the delta service to report itself connected; return the elapsed seconds, or None on timeout"""
+    start = time.monotonic()
+    attempt = 0
+    while True:
+        try:
+            # The PID check ignores a stale file left behind by a previous run
+            with open(DELTA_PID_FILE) as f:
+                if int(f.read()) == process.pid:
+                    return time.monotonic() - start
+        except (OSError, ValueError):
+            pass
+        
+        if process.poll() is not None:
+            raise RuntimeError(f"Delta service exited during startup (exit code {process.returncode})")
+        
+        elapsed = time.monotonic() - start
+        if elapsed >= timeout:
+            return None
+        time.sleep(min(0.05 * 2 ** attempt, 0.5, timeout - elapsed))
+        attempt += 1
+
+def run_dashboard_only():
+    """Replace this launcher with the Flask application - a single service needs no supervisor"""
+    print("🚀 Starting Flask Dashboard...")
+    print(f"📊 Dashboard available at: {DASHBOARD_URL}")
+    sys.stdout.flush()
+    
+    # exec never returns on success: the dashboard takes over this PID and receives Ctrl+C directly
+    os.chdir(HERE)
+    os.execv(sys.executable, [sys.executable, str(FLASK)])
+
+def wait_for_exit(processes):
+    """Block until one of the processes exits and return its name"""
+    selector = selectors.DefaultSelector()
+    pidfds = []
+    try:
+        try:
+            # A pidfd becomes readable when its process exits, so the launcher sleeps in select() until then
+            for name, process in processes.items():
+                pidfd = os.pidfd_open(process.pid)
+                pidfds.append(pidfd)
+                selector.register(pidfd, selectors.EVENT_READ, name)
+        except (AttributeError, OSError):
+            # No pidfd support (non-Linux or kernel < 5.3) - fall back to polling once a second
+            while True:
+                time.sleep(1)
+                for name, process in processes.items():
+                    if process.poll() is not None:
+                        return name
+        
+        key, _ = selector.select()[0]
+        processes[key.data].poll()  # Reap the child
+        return key.data
+    finally:
+        selector.close()
+        for pidfd in pidfds:
+            os.close(pidfd)
+
+def _signal_group(process, sig):
+    """Send a signal to the process and everything it spawned"""
+    try:
+        if hasattr(os, 'killpg'):
+            # start_new_session made the child a group leader, so its PID is also the group ID
+            os.killpg(process.pid, sig)
+        else:
+            process.send_signal(sig)
+    except ProcessLookupError:
+        pass
+
+def _wait_pidfd(process, timeout):
+    """Wait up to timeout seconds for the process to exit and return whether it did"""
+    try:
+        pidfd = os.pidfd_open(process.pid)
+    except (AttributeError, OSError):
+        # No pidfd support - Popen.wait() polls in short sleeps instead
+        try:
+            process.wait(timeout=timeout)
+            return True
+        except subprocess.TimeoutExpired:
+            return False
+    
+    try:
+        with selectors.DefaultSelector() as selector:
+            selector.register(pidfd, selectors.EVENT_READ)
+            return bool(selector.select(timeout))
+    finally:
+        os.close(pidfd)
+
+def _handle_shutdown_signal(signum, frame):
+    """Turn SIGTERM/SIGHUP from systemd or docker stop into the same orderly shutdown as Ctrl+C"""
+    raise KeyboardInterrupt
+
 def cleanup(processes):
     """Clean up processes on exit"""
     print("\n🛑 Shutting down services...")
     for name, process in processes.items():
         if process and process.poll() is None:
             print(f"🛑 Stopping {name}...")
-            process.terminate()
-            try:
-                process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                process.kill()
-                process.wait()
+            _signal_group(process, signal.SIGTERM)
+            if not _wait_pidfd(process, 5):
+                _signal_group(process, getattr(signal, 'SIGKILL', signal.SIGTERM))
+            process.wait()  # Reap the child; it has exited by now
     print("✅ All services stopped")
 
-def main():
-    """Main function to start both services"""
+def main(with_delta=True):
+    """Main function to start the dashboard, supervised together with the delta service when with_delta is set"""
+    scripts = [FLASK, DELTA] if with_delta else [FLASK]
+    missing = [script.name for script in scripts if not script.is_file()]
+    if missing:
+        print(f"❌ Missing service script(s) in {HERE}: {', '.join(missing)}")
+        sys.exit(1)
+    
+    if not with_delta:
+        run_dashboard_only()
+    
+    for name in ('SIGTERM', 'SIGHUP'):
+        if hasattr(signal, name):
+            signal.signal(getattr(signal, name), _handle_shutdown_signal)
+    
     processes = {}
     
     try:
         # Start delta service first
         processes['delta_service'] = start_delta_service()
         
-        # Wait a moment for delta service to initialize
+        # Wait until the delta service is connected to IBKR, however long that actually takes
         print("⏰ Waiting for delta service to initialize...")
-        time.sleep(5)
+        elapsed = wait_ready(processes['delta_service'])
+        if elapsed is None:
+            print("⚠️ Delta service not ready yet, starting dashboard without cached deltas")
+        else:
+            print(f"✅ Delta service ready in {elapsed:.2f}s")
         
         # Start Flask app
         processes['flask_app'] = start_flask_app()
         
         print("\n🎉 Both services started successfully!")
-        print("📊 Dashboard available at: http://localhost:7001")
+        print(f"📊 Dashboard available at: {DASHBOARD_URL}")
         print("📈 Delta service running in background")
         print("\nPress Ctrl+C to stop all services")
         
-        # Keep running until interrupted
-        while True:
-            time.sleep(1)
-            
-            # Check if processes are still running
-            for name, process in processes.items():
-                if process.poll() is not None:
-                    print(f"❌ {name} has stopped unexpectedly")
-                    return
+        # Keep running until interrupted or a service exits
+        name = wait_for_exit(processes)
+        print(f"❌ {name} has stopped unexpectedly")
             
     except KeyboardInterrupt:
         print("\n🛑 Received interrupt signal")
+    except RuntimeError as e:
+        # Delta service died during startup (e.g. IBKR unreachable) - cleanup still runs in finally
+        print(f"❌ {e}")
+        sys.exit(1)
     except Exception as e:
         print(f"❌ Error: {e}")
     finally:
         cleanup(processes)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Start the Wheel Strategy Dashboard and its IBKR delta service")
+    parser.add_argument('--dashboard-only', action='store_true', help="run only the Flask dashboard, without the delta service")
+    args = parser.parse_args()
+    main(with_delta=not args.dashboard_only) 
\ No newline at end of file